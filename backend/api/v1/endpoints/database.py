@@ -4,6 +4,7 @@ Handles operations on user imported data (long-term storage)
 """
 
 
+import asyncio
 import re
 import os   
 import tempfile
@@ -31,6 +32,7 @@ router = APIRouter()
 async def list_tables(
     request: Request,
     pattern: Optional[str] = Query(None, description="Filter table names by pattern"),
+    exact_counts: bool = Query(False, description="Exact COUNT(*) row counts instead of estimates"),
 ):
     """
     List all user data tables from mib_tool database.
@@ -42,7 +44,7 @@ async def list_tables(
         db = request.app.state.db_manager
 
         # Get tables from data database
-        tables_df = db.list_tables(database="data", pattern=pattern)
+        tables_df = await db.alist_tables(database="data", pattern=pattern, exact_counts=exact_counts)
 
         if tables_df.empty:
             return []
@@ -83,17 +85,17 @@ async def get_table_info(request: Request, table_name: str):
         db = request.app.state.db_manager
 
         # Check if table exists
-        if not db.table_exists(table_name, database="data"):
+        if not await db.atable_exists(table_name, database="data"):
             raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
 
-        # Get table info
-        info_df = db.get_table_info(table_name, database="data")
+        # Get table info and structure concurrently
+        info_df, structure_df = await asyncio.gather(
+            db.aget_table_info(table_name, database="data"),
+            db.aget_table_structure(table_name, database="data"),
+        )
         if info_df.empty:
             raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found")
 
-        # Get table structure
-        structure_df = db.get_table_structure(table_name, database="data")
-
         columns = []
         for _, col in structure_df.iterrows():
             columns.append(
@@ -68,6 +68,7 @@ async def export_table(
             database=database,
             columns=columns,
             limit=limit,
+            use_arrow=True,  # full-table exports only (ignored with a limit)
         )
         
         if df.empty:
@@ -40,6 +40,13 @@ async def list_jobs(
     job_type: Optional[str] = Query(None, description="Filter by job type"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum jobs to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    include_data: bool = Query(True, description="Include result data"),
+    after_created_at: Optional[datetime] = Query(
+        None, description="Keyset pagination: created_at of the last job on the previous page"
+    ),
+    after_job_id: Optional[str] = Query(
+        None, description="Keyset pagination: job_id of the last job on the previous page"
+    ),
 ):
     """
     List all jobs with optional filtering.
@@ -49,6 +56,9 @@ async def list_jobs(
         job_type: Filter by job type ('parse', 'export', etc.)
         limit: Maximum jobs to return
         offset: Offset for pagination
+        include_data: Whether to include each job's result
+        after_created_at: Return jobs created before this (use instead of offset for deep pages)
+        after_job_id: Tie-breaker for after_created_at
 
     Returns:
         List of jobs with metadata
@@ -56,7 +66,15 @@ async def list_jobs(
     try:
         db = request.app.state.db_manager
 
-        jobs = db.list_jobs(limit=limit, offset=offset, status=status, job_type=job_type)
+        jobs = await db.alist_jobs(
+            limit=limit,
+            offset=offset,
+            status=status,
+            job_type=job_type,
+            include_data=include_data,
+            after_created_at=after_created_at,
+            after_job_id=after_job_id,
+        )
 
         logger.info(f"Listed {len(jobs)} jobs (status={status}, type={job_type})")
 
@@ -86,7 +104,7 @@ async def get_job(
     try:
         db = request.app.state.db_manager
 
-        job = db.get_job_metadata(job_id, include_data=include_data)
+        job = await db.aget_job_metadata(job_id, include_data=include_data)
 
         if not job:
             raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
@@ -129,7 +147,7 @@ async def get_job_data(
         db = request.app.state.db_manager
 
         # Check if job exists
-        job = db.get_job_metadata(job_id, include_data=True)
+        job = db.get_job_metadata(job_id, include_data=True, result_keys=["has_data"])
         if not job:
             raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
 
@@ -164,6 +182,8 @@ async def get_job_data(
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Get job data failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to get job data: {str(e)}")
@@ -194,7 +214,7 @@ async def save_job_to_database(
         db = request.app.state.db_manager
 
         # Check if job exists
-        job = db.get_job_metadata(job_id, include_data=True)
+        job = db.get_job_metadata(job_id, include_data=True, result_keys=["has_data", "records_parsed"])
         if not job:
             raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found")
 
@@ -222,6 +242,8 @@ async def save_job_to_database(
 
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Save job to database failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to save: {str(e)}")
@@ -286,7 +286,7 @@ async def parse_session_job_async(
         # Wait if at concurrency limit
         wait_count = 0
         while True:
-            running_count = job_service.db.count_running_jobs()
+            running_count = await job_service.db.acount_running_jobs()
             
             if running_count < max_concurrent:
                 logger.info(f"Job {job_id}: Concurrency check passed ({running_count}/{max_concurrent})")
@@ -7,6 +7,7 @@ from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Request, Query
 
 from backend.models.snmp_walk_schemas import (
+    OIDResolveBatchRequest,
     SNMPDevice,
     SNMPDeviceCreate,
     SNMPDeviceUpdate,
@@ -552,6 +553,36 @@ async def search_oids(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/oid-resolver/resolve-batch")
+async def resolve_oids_batch(payload: OIDResolveBatchRequest, request: Request):
+    """
+    Resolve several OIDs in one call (cache, one exact-match query, then
+    prefix match for the rest).
+    
+    Example:
+    ```json
+    {
+        "oids": ["1.3.6.1.2.1.1.3.0", "1.3.6.1.2.1.2.2.1.2"]
+    }
+    ```
+    
+    OIDs that could not be resolved are absent from `results`.
+    """
+    try:
+        walk_service = request.app.state.walk_service
+        results = walk_service.oid_resolver.resolve_batch(payload.oids)
+        
+        return {
+            'success': True,
+            'count': len(results),
+            'results': results
+        }
+    
+    except Exception as e:
+        logger.error(f"Batch OID resolution failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/oid-resolver/resolve/{oid:path}")
 async def resolve_oid(oid: str, request: Request):
     """
@@ -180,6 +180,8 @@ class DatabaseInitializer:
                     
                     object_name VARCHAR(255) NOT NULL DEFAULT '',
                     object_oid VARCHAR(512),
+                    -- Persisted OID length: longest-prefix lookups sort on this
+                    object_oid_len SMALLINT AS (LENGTH(object_oid)) STORED,
                     object_node_type VARCHAR(50),
                     object_syntax VARCHAR(100),
                     object_access VARCHAR(50),
@@ -225,6 +227,7 @@ class DatabaseInitializer:
                     KEY idx_notification_oid (notification_oid),
                     KEY idx_notification_name (notification_name),
                     KEY idx_object_oid (object_oid(255)),
+                    KEY idx_object_oid_len (object_oid_len),
                     KEY idx_object_name (object_name),
                     KEY idx_object_node_type (object_node_type),
                     KEY idx_module_name (module_name),
@@ -237,6 +240,23 @@ class DatabaseInitializer:
                     
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
             """)
+            
+            # Tables created before object_oid_len existed get it added here
+            cursor.execute("""
+                SELECT COUNT(*)
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                AND TABLE_NAME = 'trap_master_data'
+                AND COLUMN_NAME = 'object_oid_len'
+            """)
+            if cursor.fetchone()[0] == 0:
+                cursor.execute("""
+                    ALTER TABLE trap_master_data
+                    ADD COLUMN object_oid_len SMALLINT AS (LENGTH(object_oid)) STORED AFTER object_oid,
+                    ADD INDEX idx_object_oid_len (object_oid_len)
+                """)
+                logger.info("  ✅ Added object_oid_len to trap_master_data")
+            
             logger.info(f"  ✅ trap_master_data table ready in {data_db}")
             
             return True
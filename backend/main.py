@@ -207,6 +207,9 @@ async def lifespan(app: FastAPI):
         pass
     except Exception as e:
         logger.warning(f"⚠️ Cleanup service stop error: {e}")
+
+    # Stop config file watcher (no-op unless CONFIG_HOT_RELOAD is enabled)
+    config.stop_watching()
     
     print("=" * 70)
     print("✅ Shutdown complete")
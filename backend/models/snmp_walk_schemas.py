@@ -3,7 +3,7 @@ Pydantic models for SNMP Walk feature
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 from pydantic import BaseModel, Field, validator
 
 
@@ -178,3 +178,14 @@ class SNMPWalkStats(BaseModel):
     resolved_results: int
     resolution_percentage: float
     last_walk_time: Optional[datetime]
+
+
+# ============================================
+# OID Resolver Models
+# ============================================
+
+class OIDResolveBatchRequest(BaseModel):
+    """Resolve several OIDs in one call"""
+    oids: List[Annotated[str, Field(pattern=r"^\.?[0-9]+(\.[0-9]+)*$")]] = Field(
+        ..., min_length=1, max_length=1000, description="Numeric OIDs to resolve"
+    )
@@ -102,7 +102,9 @@ class CleanupService:
             )
 
             # Get all jobs
-            jobs = self.db_manager.list_jobs(limit=100000)
+            jobs = self.db_manager.list_jobs(
+                limit=100000, fields=["status", "created_at", "completed_at"]
+            )
 
             stats = {
                 "total_jobs": len(jobs),
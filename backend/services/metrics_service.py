@@ -16,7 +16,6 @@ from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 
 from utils.logger import get_logger
-from services.config_service import Config
 
 
 class SimpleFileMetrics:
@@ -55,6 +54,9 @@ class SimpleFileMetrics:
         # In-memory metrics
         self._metrics = {}
         self._lock = threading.RLock()
+
+        # (database, operation, status) -> precomputed metric keys for record_db_op
+        self._db_op_keys = {}
         
         # Resource tracking
         self._process = psutil.Process(os.getpid())
@@ -241,6 +243,62 @@ class SimpleFileMetrics:
                 'labels': labels or {}
             }
     
+    def record_db_op(
+        self, database: str, operation: str, status: str, duration: Optional[float] = None
+    ):
+        """
+        Record one database operation in a single locked update.
+
+        Equivalent to counter('app_db_queries_total', ...) plus, when a
+        duration is given, gauge_set('app_db_query_duration_seconds', ...) and
+        counter_add('app_db_query_duration_total_seconds', ...). Metric keys
+        are built once per (database, operation, status).
+        """
+        keys = self._db_op_keys.get((database, operation, status))
+        if keys is None:
+            op_labels = {'database': database, 'operation': operation}
+            status_labels = {**op_labels, 'status': status}
+            keys = (
+                (self._make_key('app_db_queries_total', status_labels), status_labels),
+                (self._make_key('app_db_query_duration_seconds', op_labels), op_labels),
+                (self._make_key('app_db_query_duration_total_seconds', op_labels), op_labels),
+            )
+            self._db_op_keys[(database, operation, status)] = keys
+
+        (count_key, count_labels), (gauge_key, op_labels), (total_key, _) = keys
+
+        with self._lock:
+            metric = self._metrics.get(count_key)
+            if metric is None:
+                metric = self._metrics[count_key] = {
+                    'name': 'app_db_queries_total',
+                    'type': 'counter',
+                    'value': 0,
+                    'labels': dict(count_labels)
+                }
+            metric['value'] += 1
+
+            if duration is None:
+                return
+
+            duration = round(duration, 3)
+            self._metrics[gauge_key] = {
+                'name': 'app_db_query_duration_seconds',
+                'type': 'gauge',
+                'value': duration,
+                'labels': dict(op_labels)
+            }
+
+            metric = self._metrics.get(total_key)
+            if metric is None:
+                metric = self._metrics[total_key] = {
+                    'name': 'app_db_query_duration_total_seconds',
+                    'type': 'counter',
+                    'value': 0,
+                    'labels': dict(op_labels)
+                }
+            metric['value'] += duration
+
     def _make_key(self, name: str, labels: Optional[Dict] = None) -> str:
         """Create unique key for metric."""
         if labels:
@@ -328,6 +386,8 @@ def init_metrics_service(config):
     global _metrics_service
 
     if not config:
+        # Imported here: services imports this module (db_service metrics)
+        from services.config_service import Config
         config = Config()
 
     _metrics_service = SimpleFileMetrics(config)
@@ -198,16 +198,16 @@ class OIDResolverService:
         
         Internal method - no metrics tracking (tracked by caller).
         """
-        query = f"""
+        query = """
             SELECT 
                 object_oid, object_name, object_description,
                 object_node_type, object_syntax, module_name, source_table
             FROM trap_master_data
-            WHERE object_oid = '{oid}'
+            WHERE object_oid = :oid
             LIMIT 1
         """
         
-        df = self.db.db_to_df(table=None, database='data', query=query)
+        df = self.db.db_to_df(table=None, database='data', query=query, params={'oid': oid})
         
         if not df.empty:
             row = df.iloc[0]
@@ -234,18 +234,18 @@ class OIDResolverService:
             Finds: "1.3.6.1.2.1.2.2.1.5" (ifInOctets)
             Returns: "ifInOctets.3"
         """
-        query = f"""
+        query = """
             SELECT 
                 object_oid, object_name, object_description,
                 object_node_type, object_syntax, module_name, source_table,
-                LENGTH(object_oid) as oid_length
+                object_oid_len as oid_length
             FROM trap_master_data
-            WHERE '{oid}' LIKE CONCAT(object_oid, '%')
-            ORDER BY oid_length DESC
+            WHERE :oid LIKE CONCAT(object_oid, '%')
+            ORDER BY object_oid_len DESC
             LIMIT 1
         """
         
-        df = self.db.db_to_df(table=None, database='data', query=query)
+        df = self.db.db_to_df(table=None, database='data', query=query, params={'oid': oid})
         
         if not df.empty:
             row = df.iloc[0]
@@ -345,29 +345,28 @@ class OIDResolverService:
         """
         metrics = get_metrics_service()
         
-        oid_list = "', '".join(oids)
-        query = f"""
+        query = """
             SELECT 
                 object_oid, object_name, object_description,
                 object_node_type, object_syntax, module_name, source_table
             FROM trap_master_data
-            WHERE object_oid IN ('{oid_list}')
+            WHERE object_oid IN :oids
         """
         
-        df = self.db.db_to_df(table=None, database='data', query=query)
+        df = self.db.db_to_df(table=None, database='data', query=query, params={'oids': list(oids)})
         
         exact_matched = set()
         
-        for _, row in df.iterrows():
-            oid = row['object_oid']
+        for row in df.itertuples(index=False):
+            oid = row.object_oid
             result = {
                 'oid': oid,
-                'name': row['object_name'],
-                'description': row['object_description'],
-                'type': row['object_node_type'],
-                'syntax': row['object_syntax'],
-                'module': row['module_name'],
-                'source_table': row['source_table']
+                'name': row.object_name,
+                'description': row.object_description,
+                'type': row.object_node_type,
+                'syntax': row.object_syntax,
+                'module': row.module_name,
+                'source_table': row.source_table
             }
             results[oid] = result
             self.cache.put(oid, result)
@@ -470,15 +469,15 @@ class OIDResolverService:
             return []
         
         results = []
-        for _, row in df.iterrows():
+        for row in df.itertuples(index=False):
             results.append({
-                'oid': row['object_oid'],
-                'name': row['object_name'],
-                'description': row['object_description'],
-                'type': row['object_node_type'],
-                'syntax': row['object_syntax'],
-                'module': row['module_name'],
-                'source_table': row['source_table']
+                'oid': row.object_oid,
+                'name': row.object_name,
+                'description': row.object_description,
+                'type': row.object_node_type,
+                'syntax': row.object_syntax,
+                'module': row.module_name,
+                'source_table': row.source_table
             })
         
         return results
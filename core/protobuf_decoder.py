@@ -5,10 +5,14 @@ Uses official google.protobuf + grpc_tools.protoc for robust decoding
 """
 
 import json
+import mmap
+import os
 import sys
 import time
 import zipfile
 import importlib.util
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
@@ -18,8 +22,50 @@ from grpc_tools import protoc
 from utils.logger import get_logger
 from backend.services.metrics_service import get_metrics_service
 
+# Optional: faster JSON encoding of decoded output (falls back to json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Decoding is CPU-bound (parse + JSON serialize), so batches of at least
+# this many files are spread over worker processes when the caller asks
+# for more than one worker (batch/CLI use; the API decodes sequentially)
+PARALLEL_DECODE_MIN_FILES = 4
+
+# (session_dir, .proto paths + mtimes) -> (compile_schema result, compiled
+# modules, message classes); reused while none of the .proto files change
+SCHEMA_CACHE_SIZE = 32
+_schema_cache: Dict[Tuple, Tuple[Dict, Dict, Dict]] = {}
+
+# indent values orjson can lay out like json.dump (others use json.dump)
+_ORJSON_INDENT_OPTIONS = {2: orjson.OPT_INDENT_2} if orjson is not None else {}
+
+# Per-process decoder used by _decode_in_worker (set by _init_decode_worker)
+_worker_decoder = None
+
+
+def _init_decode_worker(session_dir: str):
+    """Process pool initializer: load the compiled schema once per worker."""
+    global _worker_decoder
+    sys.path.insert(0, session_dir)
+    _worker_decoder = ProtobufDecoderV2(Path(session_dir))
+    _worker_decoder.metrics = None  # metrics are recorded by the parent
+    _worker_decoder._load_message_types(list(_worker_decoder.session_dir.rglob("*.proto")))
+
+
+def _decode_in_worker(filename: str, message_type: str, output_dir: str, indent: int) -> Dict[str, Any]:
+    """Decode one file in a pool worker (see ProtobufDecoderV2._decode_single_file)."""
+    return _worker_decoder._decode_single_file(
+        filename,
+        _worker_decoder.message_classes[message_type],
+        message_type,
+        Path(output_dir),
+        indent
+    )
+
 
 class ProtobufDecoderV2:
     """
@@ -78,6 +124,20 @@ class ProtobufDecoderV2:
             
             logger.info(f"📦 Found {len(proto_files)} .proto file(s)")
             
+            cache_key = (
+                str(self.session_dir),
+                tuple(sorted((str(p), p.stat().st_mtime_ns) for p in proto_files))
+            )
+            cached = _schema_cache.get(cache_key)
+            if cached is not None:
+                result, compiled_modules, message_classes = cached
+                self.compiled_modules.update(compiled_modules)
+                self.message_classes.update(message_classes)
+                if self.metrics:
+                    self.metrics.counter('protobuf_compile_total', {'status': 'cached'})
+                logger.info("✅ Reusing compiled schema (.proto files unchanged)")
+                return dict(result)
+            
             # Setup include paths
             include_paths = [str(self.session_dir), "."]
             python_out = str(self.session_dir)
@@ -146,7 +206,7 @@ class ProtobufDecoderV2:
                 if self.verbose:
                     logger.debug(f"Dependency scores: {dependency_scores}")
                 
-                return {
+                result = {
                     "success": True,
                     "message_types": sorted_types,
                     "auto_detected_root": auto_root,
@@ -154,6 +214,12 @@ class ProtobufDecoderV2:
                     "package": package,
                     "dependency_scores": dependency_scores,
                 }
+                
+                if len(_schema_cache) >= SCHEMA_CACHE_SIZE:
+                    _schema_cache.pop(next(iter(_schema_cache)))  # oldest entry
+                _schema_cache[cache_key] = (result, dict(self.compiled_modules), dict(message_types))
+                
+                return dict(result)
             
             finally:
                 if str(self.session_dir) in sys.path:
@@ -254,16 +320,23 @@ class ProtobufDecoderV2:
         binary_files: List[str],
         message_type: str,
         output_dir: Optional[Path] = None,
-        indent: int = 2
+        indent: int = 2,
+        max_workers: int = 1
     ) -> List[Dict[str, Any]]:
         """
         Decode binary protobuf files.
         
+        Sequential by default. With max_workers > 1, batches of
+        PARALLEL_DECODE_MIN_FILES or more are decoded in a spawn-context
+        process pool (one compiled schema per worker); meant for batch/CLI
+        use, not from inside the multi-threaded API server.
+        
         Args:
             binary_files: List of binary file names (relative to session_dir)
             message_type: Root message type (full name)
             output_dir: Output directory for JSON files (default: session_dir)
             indent: JSON indentation
+            max_workers: Worker processes (default: 1 = sequential)
         
         Returns:
             List of decode results
@@ -292,29 +365,47 @@ class ProtobufDecoderV2:
         failed_count = 0
         total_fields = 0
         
+        workers = min(max_workers or 1, len(binary_files))
+        
         sys.path.insert(0, str(self.session_dir))
         
         try:
-            for filename in binary_files:
-                result = self._decode_single_file(
-                    filename,
-                    message_class,
-                    message_type,
-                    output_dir,
-                    indent
-                )
-                results.append(result)
-
-                if result["status"] == "success":
-                    success_count += 1
-                    total_fields += result.get("fields_decoded", 0)
-                else:
-                    failed_count += 1
+            if workers > 1 and len(binary_files) >= PARALLEL_DECODE_MIN_FILES:
+                if self.verbose:
+                    logger.debug(f"Decoding {len(binary_files)} files with {workers} workers")
+                # spawn, not fork: forking a threaded process can copy
+                # held locks into the child
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_decode_worker,
+                    initargs=(str(self.session_dir),)
+                ) as executor:
+                    n = len(binary_files)
+                    results = list(executor.map(
+                        _decode_in_worker,
+                        binary_files,
+                        [message_type] * n,
+                        [str(output_dir)] * n,
+                        [indent] * n
+                    ))
+            else:
+                results = [
+                    self._decode_single_file(filename, message_class, message_type, output_dir, indent)
+                    for filename in binary_files
+                ]
         
         finally:
             if str(self.session_dir) in sys.path:
                 sys.path.remove(str(self.session_dir))
 
+        for result in results:
+            if result["status"] == "success":
+                success_count += 1
+                total_fields += result.get("fields_decoded", 0)
+            else:
+                failed_count += 1
+
         # Track metrics
         if self.metrics:
             self.metrics.counter_add('protobuf_decode_total', success_count, {'status': 'success'})
@@ -348,13 +439,13 @@ class ProtobufDecoderV2:
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {filename}")
             
-            # Read binary data
-            with open(file_path, 'rb') as f:
-                binary_data = f.read()
-            
-            # Parse protobuf
+            # Parse protobuf straight from the mmapped file (no bytes copy);
+            # an empty file is an empty message (mmap cannot map 0 bytes)
             msg_instance = message_class()
-            msg_instance.ParseFromString(binary_data)
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as binary_data:
+                        msg_instance.ParseFromString(binary_data)
             
             # Convert to dict
             data = json_format.MessageToDict(
@@ -367,8 +458,11 @@ class ProtobufDecoderV2:
             output_filename = f"{Path(filename).stem}.json"
             output_path = output_dir / output_filename
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
+            if indent in _ORJSON_INDENT_OPTIONS:
+                output_path.write_bytes(orjson.dumps(data, option=_ORJSON_INDENT_OPTIONS[indent]))
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=indent, ensure_ascii=False)
             
             result.update({
                 "status": "success",
@@ -7,16 +7,52 @@ Centralized configuration handling with validation
 import base64
 import json
 import os
-from dataclasses import asdict, dataclass, field
+import threading
+from dataclasses import asdict, dataclass, field, fields
+from functools import lru_cache
 from getpass import getpass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as YamlDumper  # libyaml-backed emitter
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YamlDumper
+
 from utils.logger import get_logger
 
 
+# Decoded database password per source strategy: {strategy: (source_key, password)}.
+# Lets reload() skip re-decoding base64 / re-reading the password file when unchanged.
+_PW_CACHE: Dict[str, Tuple[Any, str]] = {}
+
+
+@lru_cache(maxsize=None)
+def dataclass_field_names(dataclass_type) -> Tuple[str, ...]:
+    """Return the field names of a dataclass type (cached per type)."""
+    return tuple(f.name for f in fields(dataclass_type))
+
+
+def dataclass_non_defaults(instance) -> Dict[str, Any]:
+    """
+    Return only the fields of a dataclass instance that differ from its defaults.
+
+    Args:
+        instance: Dataclass instance to compare against a fresh default instance
+
+    Returns:
+        Dictionary of field name -> value for non-default fields
+    """
+    default = type(instance)()
+    return {
+        name: value
+        for name in dataclass_field_names(type(instance))
+        if (value := getattr(instance, name)) != getattr(default, name)
+    }
+
+
 def init_dataclass_from_dict(dataclass_type, config_dict: Dict[str, Any]):
     """
     Initialize a dataclass from a config dictionary.
@@ -29,10 +65,8 @@ def init_dataclass_from_dict(dataclass_type, config_dict: Dict[str, Any]):
     Returns:
         Initialized dataclass instance
     """
-    from dataclasses import fields
-    
     # Get valid field names for this dataclass
-    valid_fields = {f.name for f in fields(dataclass_type)}
+    valid_fields = dataclass_field_names(dataclass_type)
     
     # Filter config_dict to only include valid fields
     filtered_config = {
@@ -40,12 +74,19 @@ def init_dataclass_from_dict(dataclass_type, config_dict: Dict[str, Any]):
         for key, value in config_dict.items() 
         if key in valid_fields
     }
+
+    # Frozen dataclasses must stay hashable: store YAML lists as tuples
+    if dataclass_type.__dataclass_params__.frozen:
+        filtered_config = {
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in filtered_config.items()
+        }
     
     # Initialize dataclass with filtered config
     return dataclass_type(**filtered_config)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectConfig:
     """Project configuration."""
     name: str = "Trishul"
@@ -67,8 +108,8 @@ class DatabaseConfig:
     traps_db: str = "trishul_traps"  # Traps data
     
     # Connection pool settings
-    pool_size: int = 10
-    max_overflow: int = 20
+    pool_size: int = 25
+    max_overflow: int = 25
     pool_timeout: int = 30
     pool_recycle: int = 3600
     pool_pre_ping: bool = True
@@ -94,7 +135,7 @@ class ParserConfig:
     deduplication_enabled: bool = True
     deduplication_strategy: str = "smart"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CacheConfig:
     """Cache configuration."""
     enabled: bool = True
@@ -103,7 +144,7 @@ class CacheConfig:
     max_size_mb: int = 500
     cleanup_on_startup: bool = False
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobsConfig:
     """Jobs configuration."""
     concurrency: int = 4
@@ -119,7 +160,7 @@ class CleanupConfig:
     delete_data: bool = True
     keep_statuses: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportConfig:
     """Export configuration."""
     export_dir: str = "./data/exports"
@@ -140,7 +181,7 @@ class UploadConfig:
     supported_extensions: List[str] = field(default_factory=lambda: [".mib", ".txt", ".my", ""])
     session_timeout_hours: int = 24
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MetricsConfig:
     """Metrics configuration."""
     directory: str = "./data/metrics"
@@ -148,14 +189,14 @@ class MetricsConfig:
     flush_interval_sec: int = 60
     monitor_interval: int = 5
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrapsConfig:
     """Traps configuration."""
     sync_strategy: str = "append" #'append', 'replace', 'newest'
     skip_synced: bool = True
     batch_size: int = 1000
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -165,12 +206,12 @@ class LoggingConfig:
     max_file_size_mb: int = 10
     backup_count: int = 5
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WebConfig:
     """Web/API configuration."""
     host: str = "0.0.0.0"
     port: int = 8000
-    cors_origins: List[str] = field(default_factory=lambda: ["*"])
+    cors_origins: Tuple[str, ...] = ("*",)
     api_v1_prefix: str = "/api/v1"
 
 @dataclass
@@ -187,11 +228,26 @@ class ExternalLinksConfig:
 class Config:
     """Centralized configuration management."""
 
+    # Top-level YAML sections consumed by the _init_*_config methods
+    _SECTION_KEYS = (
+        "project", "database", "parser", "cache", "jobs", "cleanup", "export",
+        "upload", "metrics", "traps", "logging", "web", "ui", "external_links",
+    )
+
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration from file or defaults."""
 
+        # Logger is not available during the very first _load_config() call
+        self.logger = None
+
+        # Hot-reload state (see start_watching)
+        self._reload_lock = threading.Lock()
+        self._observer = None
+        self._reload_timer = None
+
         self.config_path = config_path or self._find_config_file()
         self.raw_config = self._load_config()
+        self._sections = self._split_sections(self.raw_config)
 
         # Initialize logger after basic setup
         self.logger = get_logger(self.__class__.__name__)
@@ -220,6 +276,10 @@ class Config:
 
         self.monitoring_enabled = os.getenv('MONITORING_ENABLED', 'false').lower() == 'true'
 
+        # Optional file watcher (requires the 'watchdog' package)
+        if os.getenv('CONFIG_HOT_RELOAD', 'false').lower() == 'true':
+            self.start_watching()
+
     def reload(self):
         """
         Reload configuration from file.
@@ -231,41 +291,129 @@ class Config:
             self (for chaining)
         """
         try:
-            self.logger.info(f"Reloading configuration from {self.config_path}")
-            
-            # Reload raw config
-            self.raw_config = self._load_config()
-            
-            # Re-initialize all sub-configurations
-            self.project = self._init_project_config()
-            self.database = self._init_database_config()
-            self.parser = self._init_parser_config()
-            self.cache = self._init_cache_config()
-            self.jobs = self._init_jobs_config()
-            self.cleanup = self._init_cleanup_config()
-            self.export = self._init_export_config()
-            self.upload = self._init_upload_config()
-            self.metrics = self._init_metrics_config()
-            self.traps = self._init_traps_config()
-            self.logging = self._init_logging_config()
-            self.web = self._init_web_config()
-            self.ui = self._init_ui_config()
-            self.externallinks = self._init_externallinks_config()
-            
-            # Update version
-            self.version = self.project.version
-            
-            # Re-create directories if needed
-            self._create_directories()
-            
-            self.logger.info("✅ Configuration reloaded successfully")
-            
-            return self
+            with self._reload_lock:
+                self.logger.info(f"Reloading configuration from {self.config_path}")
+                
+                # Reload raw config
+                self.raw_config = self._load_config()
+                self._sections = self._split_sections(self.raw_config)
+                
+                # Re-initialize all sub-configurations
+                self.project = self._init_project_config()
+                self.database = self._init_database_config()
+                self.parser = self._init_parser_config()
+                self.cache = self._init_cache_config()
+                self.jobs = self._init_jobs_config()
+                self.cleanup = self._init_cleanup_config()
+                self.export = self._init_export_config()
+                self.upload = self._init_upload_config()
+                self.metrics = self._init_metrics_config()
+                self.traps = self._init_traps_config()
+                self.logging = self._init_logging_config()
+                self.web = self._init_web_config()
+                self.ui = self._init_ui_config()
+                self.externallinks = self._init_externallinks_config()
+                
+                # Update version
+                self.version = self.project.version
+                
+                # Re-create directories if needed
+                self._create_directories()
+                
+                self.logger.info("✅ Configuration reloaded successfully")
+                
+                return self
             
         except Exception as e:
-            self.logger.error(f"Failed to reload configuration: {e}", exc_info=True)
+            self.logger.error(f"Failed to reload configuration: {e}")
+            self.logger.debug("Traceback:", exc_info=True)
             raise
 
+    def start_watching(self, debounce_ms: int = 250) -> bool:
+        """
+        Watch the config file and reload() when it changes.
+        
+        Bursts of filesystem events (editors, atomic saves) are coalesced
+        into a single reload after ``debounce_ms`` of quiet. Requires the
+        optional ``watchdog`` package.
+        
+        Args:
+            debounce_ms: Coalescing window in milliseconds
+            
+        Returns:
+            True if the watcher is running, False otherwise
+        """
+        if self._observer is not None:
+            return True
+
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            self.logger.warning("Config hot reload requested but 'watchdog' is not installed")
+            return False
+
+        config_file = os.path.abspath(self.config_path)
+        config = self
+
+        class _ConfigFileHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                paths = (event.src_path, getattr(event, "dest_path", ""))
+                if config_file in (os.path.abspath(p) for p in paths if p):
+                    config._schedule_reload(debounce_ms / 1000.0)
+
+        self._last_stat = self._config_file_signature()
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_ConfigFileHandler(), os.path.dirname(config_file), recursive=False)
+        observer.start()
+        self._observer = observer
+
+        self.logger.info(f"Watching {self.config_path} for changes")
+        return True
+
+    def stop_watching(self):
+        """Stop the config file watcher started by start_watching()."""
+        if self._reload_timer is not None:
+            self._reload_timer.cancel()
+            self._reload_timer = None
+
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+
+    def _schedule_reload(self, delay: float):
+        """(Re)start the debounce timer for a watched-file change."""
+        if self._reload_timer is not None:
+            self._reload_timer.cancel()
+
+        self._reload_timer = threading.Timer(delay, self._reload_if_changed)
+        self._reload_timer.daemon = True
+        self._reload_timer.start()
+
+    def _reload_if_changed(self):
+        """Reload only if the config file's mtime/size actually changed."""
+        signature = self._config_file_signature()
+        if signature is None or signature == self._last_stat:
+            return
+
+        self._last_stat = signature
+        try:
+            self.reload()
+        except Exception:
+            # reload() already logged the failure; keep the watcher alive
+            pass
+
+    def _config_file_signature(self) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of the config file, or None if missing."""
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _find_config_file(self) -> str:
         """Find configuration file in standard locations."""
         search_paths = [
@@ -285,8 +433,7 @@ class Config:
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
         if not os.path.exists(self.config_path):
-            # Use logger if available, otherwise print
-            if hasattr(self, 'logger'):
+            if self.logger is not None:
                 self.logger.warning(f"Config file not found: {self.config_path}, using defaults")
             return {}
 
@@ -302,18 +449,22 @@ class Config:
                 return config
 
         except Exception as e:
-            # Use logger if available, otherwise print
-            if hasattr(self, 'logger'):
-                self.logger.error(f"Failed to load config: {e}", exc_info=True)
+            if self.logger is not None:
+                self.logger.error(f"Failed to load config: {e}")
+                self.logger.debug("Traceback:", exc_info=True)
             return {}
 
+    def _split_sections(self, raw_config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Unpack top-level sections once; null sections in YAML become empty dicts."""
+        return {key: (raw_config.get(key) or {}) for key in self._SECTION_KEYS}
+
     def _init_project_config(self) -> ProjectConfig:
         """Initialize project configuration."""
-        return init_dataclass_from_dict(ProjectConfig, self.raw_config.get("project", {}))
+        return init_dataclass_from_dict(ProjectConfig, self._sections["project"])
 
     def _init_parser_config(self) -> ParserConfig:
         """Initialize parser configuration."""
-        config = init_dataclass_from_dict(ParserConfig, self.raw_config.get("parser", {}))
+        config = init_dataclass_from_dict(ParserConfig, self._sections["parser"])
         
         # Special handling: expand and filter paths
         config.mib_search_dirs = [
@@ -332,7 +483,7 @@ class Config:
 
     def _init_database_config(self) -> DatabaseConfig:
         """Initialize database configuration."""
-        cfg = self.raw_config.get("database", {})
+        cfg = self._sections["database"]
         
         # Auto-initialize most fields
         config = init_dataclass_from_dict(DatabaseConfig, cfg)
@@ -345,62 +496,77 @@ class Config:
                 self.logger.debug("Using database password from environment variable")
             # 2. Base64 encoded in config
             elif cfg.get("password_base64"):
-                try:
-                    config.password = base64.b64decode(cfg["password_base64"]).decode("utf-8")
-                    self.logger.debug("Using database password from config (base64)")
-                except Exception as e:
-                    self.logger.warning(f"Failed to decode password: {e}")
+                key = hash(cfg["password_base64"])
+                cached = _PW_CACHE.get("b64")
+                if cached and cached[0] == key:
+                    config.password = cached[1]
+                else:
+                    try:
+                        config.password = base64.b64decode(cfg["password_base64"]).decode("utf-8")
+                        _PW_CACHE["b64"] = (key, config.password)
+                        self.logger.debug("Using database password from config (base64)")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to decode password: {e}")
             # 3. Password file
             elif cfg.get("password_file"):
-                password_file = Path(cfg["password_file"])
-                if password_file.exists():
-                    config.password = password_file.read_text().strip()
+                try:
+                    st = os.stat(cfg["password_file"])
+                except OSError:
+                    st = None
+                if st is not None:
+                    key = (cfg["password_file"], st.st_mtime_ns, st.st_size)
+                    cached = _PW_CACHE.get("file")
+                    if cached and cached[0] == key:
+                        config.password = cached[1]
+                    else:
+                        config.password = Path(cfg["password_file"]).read_text().strip()
+                        _PW_CACHE["file"] = (key, config.password)
         
         return config
 
     def _init_export_config(self) -> ExportConfig:
         """Initialize export configuration."""
-        return init_dataclass_from_dict(ExportConfig, self.raw_config.get("export", {}))
+        return init_dataclass_from_dict(ExportConfig, self._sections["export"])
 
     def _init_cache_config(self) -> CacheConfig:
         """Initialize cache configuration."""
-        return init_dataclass_from_dict(CacheConfig, self.raw_config.get("cache", {}))
+        return init_dataclass_from_dict(CacheConfig, self._sections["cache"])
 
     def _init_logging_config(self) -> LoggingConfig:
         """Initialize logging configuration."""
-        return init_dataclass_from_dict(LoggingConfig, self.raw_config.get("logging", {}))
+        return init_dataclass_from_dict(LoggingConfig, self._sections["logging"])
 
     def _init_web_config(self) -> WebConfig:
         """Initialize web/API configuration."""
-        return init_dataclass_from_dict(WebConfig, self.raw_config.get("web", {}))
+        return init_dataclass_from_dict(WebConfig, self._sections["web"])
 
     def _init_upload_config(self) -> UploadConfig:
         """Initialize upload configuration."""
-        return init_dataclass_from_dict(UploadConfig, self.raw_config.get("upload", {}))
+        return init_dataclass_from_dict(UploadConfig, self._sections["upload"])
     
     def _init_metrics_config(self) -> MetricsConfig:
         """Initialize export configuration."""
-        return init_dataclass_from_dict(MetricsConfig, self.raw_config.get("metrics", {}))
+        return init_dataclass_from_dict(MetricsConfig, self._sections["metrics"])
     
     def _init_traps_config(self) -> TrapsConfig:
         """Initialize traps configuration."""
-        return init_dataclass_from_dict(TrapsConfig, self.raw_config.get("traps", {}))
+        return init_dataclass_from_dict(TrapsConfig, self._sections["traps"])
 
     def _init_jobs_config(self) -> JobsConfig:
         """Initialize jobs configuration."""
-        return init_dataclass_from_dict(JobsConfig, self.raw_config.get("jobs", {}))
+        return init_dataclass_from_dict(JobsConfig, self._sections["jobs"])
 
     def _init_cleanup_config(self) -> CleanupConfig:
         """Initialize cleanup configuration."""
-        return init_dataclass_from_dict(CleanupConfig, self.raw_config.get("cleanup", {}))
+        return init_dataclass_from_dict(CleanupConfig, self._sections["cleanup"])
 
     def _init_ui_config(self) -> UIConfig:
         """Initialize UI configuration."""
-        return init_dataclass_from_dict(UIConfig, self.raw_config.get("ui", {}))
+        return init_dataclass_from_dict(UIConfig, self._sections["ui"])
 
     def _init_externallinks_config(self) -> ExternalLinksConfig:
         """Initialize external links configuration."""
-        return init_dataclass_from_dict(ExternalLinksConfig, self.raw_config.get("external_links", {}))
+        return init_dataclass_from_dict(ExternalLinksConfig, self._sections["external_links"])
 
     def _create_directories(self):
         """Create required directories if they don't exist."""
@@ -416,10 +582,11 @@ class Config:
         if self.logging.file:
             directories.append(os.path.dirname(self.logging.file))
 
-        for directory in directories:
+        # dict.fromkeys drops duplicate entries while preserving order
+        for directory in dict.fromkeys(directories):
             if directory:
                 try:
-                    Path(directory).mkdir(parents=True, exist_ok=True)
+                    os.makedirs(directory, exist_ok=True)
                 except Exception as e:
                     self.logger.warning(f"Failed to create directory {directory}: {e}")
 
@@ -487,24 +654,54 @@ class Config:
         }
 
     def save(self, path: Optional[str] = None):
-        """Save configuration to file."""
-        save_path = path or self.config_path
-
-        # Convert to dict for saving
-        config_dict = self.to_dict()
-
-        # Encode password if present
-        if self.database.password:
-            config_dict["database"]["password_base64"] = base64.b64encode(
-                self.database.password.encode()
-            ).decode("utf-8")
-            del config_dict["database"]["password"]
+        """
+        Save configuration to file.
 
-        # Save to file
-        Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+        Only values that differ from the dataclass defaults are written;
+        sections with no overrides are omitted entirely.
+        """
+        save_path = path or self.config_path
 
-        with open(save_path, "w", encoding="utf-8") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+        # Convert to dict for saving (non-default fields only)
+        config_dict = {}
+        for key, section in (
+            ("project", self.project),
+            ("database", self.database),
+            ("parser", self.parser),
+            ("cache", self.cache),
+            ("jobs", self.jobs),
+            ("cleanup", self.cleanup),
+            ("export", self.export),
+            ("upload", self.upload),
+            ("metrics", self.metrics),
+            ("traps", self.traps),
+            ("logging", self.logging),
+            ("web", self.web),
+            ("ui", self.ui),
+            ("external_links", self.externallinks),
+        ):
+            overrides = dataclass_non_defaults(section)
+            if key == "database":
+                # Never persist the plain-text password; store it base64 encoded
+                overrides.pop("password", None)
+                if self.database.password:
+                    overrides["password_base64"] = base64.b64encode(
+                        self.database.password.encode()
+                    ).decode("utf-8")
+            if overrides:
+                config_dict[key] = overrides
+
+        # Save to file (write to a temp file first so readers never see a torn config)
+        save_file = Path(save_path)
+        save_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = save_file.with_name(save_file.name + ".tmp")
+
+        with open(temp_file, "w", encoding="utf-8", buffering=65536) as f:
+            yaml.dump(
+                config_dict, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+            )
+
+        os.replace(temp_file, save_file)
 
         self.logger.info(f"Configuration saved to {save_path}")
 
@@ -525,17 +722,14 @@ class Config:
         if not self.get_all_mib_search_paths():
             issues.append("No valid MIB search paths found")
 
-        # Check export directory is writable
-        try:
-            Path(self.export.export_dir).mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            issues.append(f"Cannot create export directory: {e}")
+        # Check export directory is writable (directories are created by
+        # _create_directories; validation itself must not touch the filesystem)
+        if not os.access(self.export.export_dir, os.W_OK):
+            issues.append(f"Export directory is not writable: {self.export.export_dir}")
 
         # Check cache directory is writable
-        try:
-            Path(self.cache.directory).mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            issues.append(f"Cannot create cache directory: {e}")
+        if not os.access(self.cache.directory, os.W_OK):
+            issues.append(f"Cache directory is not writable: {self.cache.directory}")
 
         # Validate chunk sizes
         if self.export.chunk_size < 100:
@@ -4,31 +4,54 @@ Database Manager - Restructured and Unified
 Handles all database operations across 3 databases with DataFrame support
 """
 
+import asyncio
+import csv
+import hashlib
 import json
+import os
 import re
+import tempfile
+import threading
 import time
+import numpy as np
 import pandas as pd
 import warnings
-from datetime import datetime
-from functools import wraps
-from urllib.parse import quote_plus
-from concurrent.futures import ThreadPoolExecutor
+import weakref
+from collections import deque
+from datetime import date, datetime
+from functools import lru_cache, wraps
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, as_completed, wait
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 # SQLAlchemy imports
 try:
     from sqlalchemy import (
+        TextClause,
+        bindparam,
         create_engine,
-        inspect,
         text
     )
-    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.dialects import mysql
+    from sqlalchemy.engine import URL
+    from sqlalchemy.exc import InterfaceError, OperationalError
 except ImportError as e:
     print(f"[ERROR] SQLAlchemy not installed: {e}")
     print("[INFO] Install with: pip install sqlalchemy pymysql")
     raise
 
+# Optional: Arrow-native reader for large SELECTs (falls back to pandas)
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
+# Optional: faster JSON encoding/decoding (falls back to json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from utils.logger import get_logger
 
 from backend.services.metrics_service import get_metrics_service
@@ -36,9 +59,190 @@ from backend.services.metrics_service import get_metrics_service
 # Suppress SQLAlchemy warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="sqlalchemy")
 
+# Copy-on-Write lets _prepare_dataframe work on a shallow copy of the caller's
+# frame (always on in pandas >= 3, where the option is deprecated)
+if int(pd.__version__.split(".")[0]) < 3:
+    try:
+        pd.options.mode.copy_on_write = True
+    except Exception:
+        pass
+
+# Escapes for text cells written to LOAD DATA files (ESCAPED BY '\\')
+_LOAD_DATA_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"}
+)
+
+# MySQL error codes raised when LOAD DATA LOCAL INFILE is disabled
+_LOCAL_INFILE_DISABLED_ERRORS = {1148, 2068, 3948, 3950}
+
+# MySQL client errors for a dead connection ("server has gone away", "lost connection")
+_CONNECTION_LOST_ERRORS = {2006, 2013}
+
+# Renders bound parameters as MySQL literals for connectorx ('named' paramstyle
+# so '%' is not doubled the way the pymysql dialect does)
+_LITERAL_DIALECT = mysql.dialect(paramstyle="named")
+
+# Column-name rules applied before the dtype in _create_optimized_table
+# (first matching suffix wins)
+_SUFFIX_SQL_TYPES = (
+    ("_oid", "VARCHAR(512)"),
+    ("_name", "VARCHAR(256)"),
+    ("_description", "TEXT"),
+)
+_JSON_COLUMNS = frozenset({"tc_enumerations", "notification_objects_detail"})
+
+# Rows measured per step by _max_text_length
+_TEXT_LENGTH_BLOCK = 100_000
+
+# pandas dtype name -> SQL type (datetime64[...] dtypes are matched by prefix;
+# any other dtype is treated as text)
+_DTYPE_SQL_TYPES = {
+    "int8": "TINYINT",
+    "int16": "SMALLINT",
+    "int32": "INT",
+    "int64": "BIGINT",
+    "uint8": "TINYINT UNSIGNED",
+    "uint16": "SMALLINT UNSIGNED",
+    "uint32": "INT UNSIGNED",
+    "uint64": "BIGINT UNSIGNED",
+    "Int8": "TINYINT",
+    "Int16": "SMALLINT",
+    "Int32": "INT",
+    "Int64": "BIGINT",
+    "UInt8": "TINYINT UNSIGNED",
+    "UInt16": "SMALLINT UNSIGNED",
+    "UInt32": "INT UNSIGNED",
+    "UInt64": "BIGINT UNSIGNED",
+    "float32": "FLOAT",
+    "float64": "DOUBLE",
+    "Float32": "FLOAT",
+    "Float64": "DOUBLE",
+    "bool": "BOOLEAN",
+    "boolean": "BOOLEAN",
+}
+
+
+def _json_default(o: Any) -> Any:
+    """JSON fallback for pandas/numpy/datetime values (orjson handles most natively)."""
+    if isinstance(o, pd.Timestamp):
+        return o.isoformat()
+    if isinstance(o, np.datetime64):
+        return pd.Timestamp(o).isoformat()
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    if isinstance(o, np.integer):
+        return int(o)
+    if isinstance(o, np.floating):
+        return float(o)
+    if isinstance(o, np.ndarray):
+        return o.tolist()
+    if pd.isna(o):
+        return None
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+# numpy scalars/arrays natively, non-str dict keys like json.dumps
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def _json_cell(value: Any) -> str:
+    """Serialize a dict/list cell to JSON text; other values are stringified."""
+    if not isinstance(value, (dict, list)):
+        return str(value)
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+def _json_loads(value: Union[str, bytes]) -> Any:
+    """Parse a JSON column value (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _json_or_default(value: Optional[Union[str, bytes]], default: Any) -> Any:
+    """Parse a JSON column value, returning ``default`` when empty or malformed."""
+    if not value:
+        return default
+    try:
+        return _json_loads(value)
+    except ValueError:
+        return default
+
+
+def _max_text_length(series: pd.Series, stop_at: int = 65536) -> float:
+    """
+    Length of the longest value of ``series`` as text (NaN if all null).
+
+    Measured in blocks of ``_TEXT_LENGTH_BLOCK`` rows, stopping early once
+    a value reaches ``stop_at`` (the LONGTEXT threshold, where the exact
+    maximum no longer matters).
+    """
+    longest = np.nan
+    for start in range(0, len(series), _TEXT_LENGTH_BLOCK):
+        # fmax skips NaN (an all-null block)
+        longest = np.fmax(longest, _block_text_length(series.iloc[start : start + _TEXT_LENGTH_BLOCK]))
+        if longest >= stop_at:
+            break
+    return longest
+
+
+def _block_text_length(series: pd.Series) -> float:
+    """
+    Longest value of ``series`` as text (NaN if all null).
+
+    String columns are measured directly; only columns holding other
+    objects are converted with ``astype(str)`` first (``.str.len()`` would
+    return ``len()`` of a dict or list, not of its text).
+    """
+    if pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+        return series.str.len().max()
+    # Only stringify non-null cells: nulls are stored as NULL, not as "None"/"nan"
+    values = series[series.notna()]
+    return values.astype(str).str.len().max() if len(values) else np.nan
+
+
+@lru_cache(maxsize=256)
+def _column_sql_types(
+    columns: Tuple[str, ...], dtypes: Tuple[str, ...]
+) -> Tuple[Optional[str], ...]:
+    """
+    SQL type per column from its name and dtype, for _create_optimized_table.
+
+    None marks a text column, whose type depends on the longest value.
+    """
+    sql_types = []
+    for col, dtype in zip(columns, dtypes):
+        # Name rules first, then the dtype
+        sql_type = next((t for suffix, t in _SUFFIX_SQL_TYPES if col.endswith(suffix)), None)
+        if sql_type is None and col in _JSON_COLUMNS:
+            sql_type = "JSON"
+        elif sql_type is None:
+            sql_type = "DATETIME" if dtype.startswith("datetime64") else _DTYPE_SQL_TYPES.get(dtype)
+        sql_types.append(sql_type)
+    return tuple(sql_types)
+
+
+def _is_connection_lost(error: Exception) -> bool:
+    """Check if a SQLAlchemy DBAPI error means the pooled connection is dead."""
+    orig = getattr(error, "orig", None)
+    args = getattr(orig, "args", ())
+    return bool(args) and args[0] in _CONNECTION_LOST_ERRORS
+
 
 def retry_on_connection_error(max_retries: int = 3, delay: float = 1.0):
-    """Decorator to retry database operations on connection errors."""
+    """
+    Decorator to retry database operations on connection errors.
+
+    Only errors that propagate out of the wrapped method are retried (most
+    DatabaseManager methods handle their own errors, which is why engines
+    pre-ping on checkout by default). On "server has gone away" / "lost
+    connection" the pools are disposed before retrying with exponential
+    backoff.
+    """
 
     def decorator(func):
         @wraps(func)
@@ -47,13 +251,15 @@ def retry_on_connection_error(max_retries: int = 3, delay: float = 1.0):
             for attempt in range(max_retries):
                 try:
                     return func(self, *args, **kwargs)
-                except OperationalError as e:
+                except (OperationalError, InterfaceError) as e:
                     last_exception = e
                     if attempt < max_retries - 1:
                         self.logger.warning(
                             f"Connection error (attempt {attempt + 1}/{max_retries}): {str(e)[:100]}"
                         )
-                        time.sleep(delay * (attempt + 1))
+                        if _is_connection_lost(e):
+                            self._dispose_pools()
+                        time.sleep(delay * (2 ** attempt))
                         if not self._test_connection():
                             self._reconnect()
                     else:
@@ -67,6 +273,124 @@ def retry_on_connection_error(max_retries: int = 3, delay: float = 1.0):
     return decorator
 
 
+@lru_cache(maxsize=256)
+def _compile_select_template(
+    table: str,
+    filter_shape: Tuple[Tuple[str, str, int], ...],
+    columns: Tuple[str, ...],
+    has_limit: bool,
+    has_offset: bool,
+    sort_by: Optional[str],
+    sort_order: Optional[str],
+) -> TextClause:
+    """
+    Build the TextClause for a SELECT query shape.
+
+    ``filter_shape`` holds one ``(column, operator, n_values)`` entry per
+    filter; placeholder names match the params built by
+    DatabaseManager._build_select_query (``:f<i>`` / ``:f<i>_<j>``; IN and
+    NOT IN lists are a single expanding ``:f<i>``, so the SQL does not
+    depend on the list length). Identifiers are backtick-quoted.
+
+    The clause is cached per shape and reused with fresh params, so it is
+    only built (and compiled by SQLAlchemy) once per shape.
+    """
+    cols = ", ".join(_quote_ident(col) for col in columns) if columns else "*"
+    sql = f"SELECT {cols} FROM {_quote_ident(table)}"
+
+    where_clauses = []
+    expanding = []
+    for i, (col, op, n) in enumerate(filter_shape):
+        key = f"f{i}"
+        col = _quote_ident(col)[1:-1]
+        if op == "contains":
+            where_clauses.append(f"`{col}` LIKE :{key}")
+        elif op == "regex":
+            where_clauses.append(f"`{col}` REGEXP :{key}")
+        elif op == "not_empty":
+            where_clauses.append(f"(`{col}` IS NOT NULL AND `{col}` != '')")
+        elif op == "empty":
+            where_clauses.append(f"(`{col}` IS NULL OR `{col}` = '')")
+        elif op in ("in", "not_in"):
+            if n == 0:
+                where_clauses.append("1=0" if op == "in" else "1=1")
+            else:
+                keyword = "IN" if op == "in" else "NOT IN"
+                where_clauses.append(f"`{col}` {keyword} :{key}")
+                expanding.append(bindparam(key, expanding=True))
+        elif op == "gt":
+            where_clauses.append(f"`{col}` > :{key}")
+        elif op == "lt":
+            where_clauses.append(f"`{col}` < :{key}")
+        elif op == "between":
+            where_clauses.append(f"`{col}` BETWEEN :{key}_0 AND :{key}_1")
+        else:
+            where_clauses.append(f"`{col}` = :{key}")
+
+    if where_clauses:
+        sql += " WHERE " + " AND ".join(where_clauses)
+
+    if sort_by:
+        sql += f" ORDER BY {_quote_ident(sort_by)} {sort_order}"
+
+    if has_limit:
+        sql += " LIMIT :limit"
+        if has_offset:
+            sql += " OFFSET :offset"
+
+    clause = text(sql)
+    return clause.bindparams(*expanding) if expanding else clause
+
+
+def _text_with_params(query: str, params: Optional[Dict]):
+    """text(query) with list/tuple params bound as expanding (IN-list) parameters."""
+    clause = text(query)
+    expanding = [
+        bindparam(key, expanding=True)
+        for key, value in (params or {}).items()
+        if isinstance(value, (list, tuple))
+    ]
+    return clause.bindparams(*expanding) if expanding else clause
+
+
+def _quote_ident(name: str) -> str:
+    """Backtick-quote a MySQL identifier (embedded backticks are doubled)."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+@lru_cache(maxsize=1024)
+def _job_update_stmt(columns: Tuple[str, ...]):
+    """Cached UPDATE jobs statement for one set of columns (in a fixed order)."""
+    assignments = ", ".join(f"{col} = :{col}" for col in columns)
+    return text(f"UPDATE jobs SET {assignments} WHERE job_id = :job_id")
+
+
+# Column order of the jobs table used by _job_upsert_stmt
+_JOB_COLUMNS = (
+    "job_id", "job_type", "job_name", "status", "created_at", "started_at",
+    "completed_at", "progress", "message", "result_data", "errors", "metadata",
+)
+
+
+@lru_cache(maxsize=1024)
+def _job_upsert_stmt(update_columns: Tuple[str, ...]):
+    """
+    Cached INSERT ... ON DUPLICATE KEY UPDATE jobs statement (updates only
+    update_columns).
+
+    The update branch also runs LAST_INSERT_ID(1), so the result's lastrowid
+    is 1 when an existing job was updated and 0 when a new one was inserted
+    (rowcount can't tell: CLIENT_FOUND_ROWS reports an unchanged row as 1).
+    """
+    columns = ", ".join(_JOB_COLUMNS)
+    values = ", ".join(f":{col}" for col in _JOB_COLUMNS)
+    updates = ", ".join(f"{col} = VALUES({col})" for col in update_columns)
+    updates += ", job_id = IF(LAST_INSERT_ID(1), job_id, job_id)"
+    return text(
+        f"INSERT INTO jobs ({columns}) VALUES ({values}) ON DUPLICATE KEY UPDATE {updates}"
+    )
+
+
 class DatabaseManager:
     """
     Unified Database Manager for MIB Tool
@@ -86,7 +410,18 @@ class DatabaseManager:
     MAX_IDENTIFIER_LENGTH = 64
     MAX_VARCHAR_LENGTH = 65535
     DEFAULT_CHUNK_SIZE = 10000
-    RESERVED_WORDS = {"select", "from", "where", "table", "database", "index", "order", "group"}
+    COPY_CHUNK_ROWS = 200_000  # id-range size per INSERT ... SELECT in copy_job_to_user_db
+    COUNT_BATCH_TABLES = 50  # tables per UNION ALL COUNT(*) statement in list_tables
+    TABLE_CACHE_TTL = 10.0  # seconds a table_exists answer is reused
+    READ_CONN_PING_IDLE = 10.0  # seconds idle before a cached read connection is pinged
+    RESERVED_WORDS = frozenset(
+        {"select", "from", "where", "table", "database", "index", "order", "group"}
+    )
+
+    # Identifier patterns (compiled once)
+    _IDENT_RE = re.compile(r"^[a-zA-Z0-9_]+$")
+    _TABLE_NAME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
+    _INVALID_IDENT_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
 
     def __init__(self, config):
         """
@@ -98,12 +433,17 @@ class DatabaseManager:
         self.config = config
         self.logger = get_logger(self.__class__.__name__)
 
-        self._executor = ThreadPoolExecutor(max_workers=2)
+        # Sized to the connection pool so parallel chunk inserts never wait on checkout
+        self._executor = ThreadPoolExecutor(max_workers=max(2, config.database.pool_size))
 
         # Optimized settings
         self.chunk_size = getattr(config.export, "chunk_size", self.DEFAULT_CHUNK_SIZE)
         self.use_batch_insert = True
 
+        # Bulk load via LOAD DATA LOCAL INFILE (disabled automatically if the
+        # driver or server does not allow it)
+        self.use_load_data = True
+
         # Connection retry settings
         self.max_retries = 3
         self.retry_delay = 1.0
@@ -122,7 +462,7 @@ class DatabaseManager:
         }
 
         # Performance tracking
-        self._operation_times = []
+        self._operation_times = deque(maxlen=100)  # last 100 operations
 
         # ✅ Database configuration mapping
         self.db_configs = {
@@ -150,6 +490,23 @@ class DatabaseManager:
         self.jobs_engine = None  
         self.traps_engine = None 
 
+        # db_type -> engine lookup used by _get_engine (populated in _init_engines)
+        self._engines: Dict[str, Any] = {}
+
+        # (schema, table) -> (checked_at, exists) for table_exists; dropped on our own DDL
+        self._table_exists_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+
+        # Detached DBAPI connections used only for liveness pings, keyed by id(engine)
+        self._ping_conns: Dict[int, Any] = {}
+        self._ping_lock = threading.Lock()
+
+        # Per-thread AUTOCOMMIT connections reused by read-only paths, capped so
+        # they never take more than half of the pool
+        self._tls = threading.local()
+        self._read_conns = weakref.WeakSet()
+        self._read_conns_lock = threading.Lock()
+        self._max_read_conns = max(1, config.database.pool_size // 2)
+
         self.connected = False
 
         # Initialize connections
@@ -167,6 +524,7 @@ class DatabaseManager:
             
             # Track unique database names to their engines
             db_name_to_engine = {}
+            engines = {}
             
             # Create engines only for unique database names
             for db_type, db_config in self.db_configs.items():
@@ -175,23 +533,24 @@ class DatabaseManager:
                 
                 # Reuse existing engine if database name already processed
                 if db_name in db_name_to_engine:
-                    setattr(self, engine_attr, db_name_to_engine[db_name])
+                    engine = db_name_to_engine[db_name]
                     self.logger.debug(f"Reusing engine for {db_type} DB: {db_name}")
                 else:
                     # Create new engine
                     engine = self._create_engine(db_name, password)
-                    setattr(self, engine_attr, engine)
                     db_name_to_engine[db_name] = engine
                     self.logger.debug(f"Created new engine for {db_type} DB: {db_name}")
+
+                setattr(self, engine_attr, engine)
+                engines[db_type] = engine
+
+            self._engines = engines
             
-            # Test connections
-            if self._test_all_connections():
-                self.connected = True
-                self.logger.info("✅ All database engines initialized successfully")
-                for db_type, db_config in self.db_configs.items():
-                    self.logger.info(f"   {db_type.capitalize()} DB: {db_config['name']}")
-            else:
-                raise ConnectionError("Failed to establish database connections")
+            # Every engine ran SELECT 1 in _create_engine (which raises on failure)
+            self.connected = True
+            self.logger.info("✅ All database engines initialized successfully")
+            for db_type, db_config in self.db_configs.items():
+                self.logger.info(f"   {db_type.capitalize()} DB: {db_config['name']}")
                 
         except Exception as e:
             self.logger.error(f"Engine initialization failed: {str(e)[:200]}")
@@ -210,17 +569,26 @@ class DatabaseManager:
         Returns:
             SQLAlchemy engine
         """
-        connection_string = self._build_connection_string(database, password)
+        connection_url = self._build_connection_url(database, password)
+
+        connect_args = {"connect_timeout": 10, "charset": "utf8mb4"}
+        if self._detect_mysql_driver() == "pymysql":
+            # Allow client-side files for LOAD DATA LOCAL INFILE (see _load_data_infile)
+            connect_args["local_infile"] = True
+        else:
+            self.use_load_data = False
         
         engine = create_engine(
-            connection_string,
+            connection_url,
             pool_size=self.config.database.pool_size,
             max_overflow=self.config.database.max_overflow,
-            pool_timeout=30,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=False,
-            connect_args={"connect_timeout": 10, "charset": "utf8mb4"},
+            pool_timeout=self.config.database.pool_timeout,
+            # on by default: the methods wrapped by retry_on_connection_error
+            # catch their own errors, so a stale connection must be caught here
+            pool_pre_ping=self.config.database.pool_pre_ping,
+            pool_recycle=self.config.database.pool_recycle,  # keep below MySQL wait_timeout
+            echo=self.config.database.echo,
+            connect_args=connect_args,
         )
         
         # Test connection and create database if needed
@@ -231,38 +599,35 @@ class DatabaseManager:
         except Exception as e:
             if "Unknown database" in str(e):
                 self.logger.info(f"Database '{database}' not found. Creating...")
-                if self._create_database(database, password):
-                    # Recreate engine after database creation
-                    engine = create_engine(
-                        connection_string,
-                        pool_size=self.config.database.pool_size,
-                        max_overflow=self.config.database.max_overflow,
-                        pool_timeout=30,
-                        pool_pre_ping=True,
-                        pool_recycle=3600,
-                        echo=False,
-                        connect_args={"connect_timeout": 10, "charset": "utf8mb4"},
-                    )
-                else:
+                if not self._create_database(database, password):
                     raise
+                # The failed attempt left no pooled connection, so the same engine can retry
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+                self.logger.debug(f"Connected to database: {database}")
             else:
                 raise
         
         return engine
 
-    def _build_connection_string(self, database: str, password: str) -> str:
-        """Build SQLAlchemy connection string."""
+    def _build_connection_url(self, database: str, password: str) -> URL:
+        """Build SQLAlchemy connection URL (credentials are escaped by URL)."""
         driver = self._detect_mysql_driver()
-        password_encoded = quote_plus(password)
-        
-        return (
-            f"mysql+{driver}://{self.config.database.user}:{password_encoded}@"
-            f"{self.config.database.host}:{self.config.database.port}/"
-            f"{database}?charset=utf8mb4"
+
+        return URL.create(
+            f"mysql+{driver}",
+            username=self.config.database.user,
+            password=password,
+            host=self.config.database.host,
+            port=self.config.database.port,
+            database=database,
+            query={"charset": "utf8mb4"},
         )
 
-    def _detect_mysql_driver(self) -> str:
-        """Detect available MySQL driver."""
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _detect_mysql_driver() -> str:
+        """Detect available MySQL driver (probed once per process)."""
         drivers = [
             ("pymysql", "pymysql"),
             ("MySQLdb", "mysqldb"),
@@ -281,7 +646,7 @@ class DatabaseManager:
     def _create_database(self, database: str, password: str) -> bool:
         """Create database if it doesn't exist."""
         # Validate database name to prevent SQL injection
-        if not re.match(r'^[a-zA-Z0-9_]+$', database):
+        if not self._IDENT_RE.match(database):
             self.logger.error(f"Invalid database name: {database}")
             return False
         
@@ -321,29 +686,32 @@ class DatabaseManager:
     # ============================================
 
     def health_check(self) -> Dict[str, Any]:
-        """Check health of all databases."""
+        """Check health of all databases (one ping per unique engine)."""
         health = {}
         
-        # ✅ Dynamically check all configured databases
-        for db_type, db_config in self.db_configs.items():
+        # ✅ Group configured databases by engine so shared engines are pinged once
+        by_engine = {}
+        for db_type in self.db_configs:
             db_key = f"{db_type}_db"
             health[db_key] = {"status": "unknown", "error": None}
+            engine = self._engines.get(db_type)
             
+            if not engine:
+                health[db_key]["status"] = "not_initialized"
+            elif not self.connected:
+                health[db_key]["status"] = "not_connected"
+            else:
+                by_engine.setdefault(id(engine), (engine, []))[1].append(db_key)
+        
+        for engine, db_keys in by_engine.values():
+            result = {"status": "healthy", "error": None}
             try:
-                engine = getattr(self, db_config['engine_attr'], None)
-                
-                if self.connected and engine:
-                    with engine.connect() as conn:
-                        conn.execute(text("SELECT 1"))
-                    health[db_key]["status"] = "healthy"
-                elif engine:
-                    health[db_key]["status"] = "not_connected"
-                else:
-                    health[db_key]["status"] = "not_initialized"
-                    
+                self._ping(engine)
             except Exception as e:
-                health[db_key]["status"] = "unhealthy"
-                health[db_key]["error"] = str(e)[:100]
+                result = {"status": "unhealthy", "error": str(e)[:100]}
+            
+            for db_key in db_keys:
+                health[db_key] = dict(result)
         
         return health
 
@@ -386,14 +754,18 @@ class DatabaseManager:
                 self._executor.shutdown(wait=True)
                 self.logger.debug("Thread pool executor closed")
             
+            # ✅ Release cached read connections before disposing their engines
+            for conn in list(self._read_conns):
+                self._close_read_connection(conn)
+
             # ✅ Dispose only unique engines
             disposed_ids = set()
-            for db_config in self.db_configs.values():
-                engine = getattr(self, db_config['engine_attr'], None)
-                if engine and id(engine) not in disposed_ids:
+            for db_type, engine in self._engines.items():
+                if id(engine) not in disposed_ids:
+                    self._close_ping_conn(engine)
                     engine.dispose()
                     disposed_ids.add(id(engine))
-                    self.logger.debug(f"Engine closed for {db_config['name']}")
+                    self.logger.debug(f"Engine closed for {self.db_configs[db_type]['name']}")
             
             self.connected = False
             self.logger.info("✅ All database connections closed")
@@ -422,25 +794,66 @@ class DatabaseManager:
             return False
         
         try:
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            self._ping(engine)
             return True
         except Exception:
             return False
 
+    def _ping(self, engine):
+        """
+        Ping an engine's server, raising on failure.
+
+        Uses a cached DBAPI connection (detached from the pool) and
+        ``ping(reconnect=True)``; falls back to a pooled ``SELECT 1`` when the
+        cached connection is missing or broken, then refreshes the cache.
+        """
+        with self._ping_lock:
+            raw_conn = self._ping_conns.get(id(engine))
+            if raw_conn is not None:
+                try:
+                    raw_conn.ping(reconnect=True)
+                    return
+                except Exception:
+                    self._close_ping_conn(engine)
+
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+            try:
+                raw_conn = engine.raw_connection()
+                raw_conn.detach()  # don't hold a pool slot for pings
+                self._ping_conns[id(engine)] = raw_conn
+            except Exception as e:
+                self.logger.debug(f"Could not cache ping connection: {e}")
+
+    def _dispose_pools(self):
+        """Drop all pooled connections (engines stay usable and reconnect lazily)."""
+        disposed_ids = set()
+        for engine in self._engines.values():
+            if id(engine) not in disposed_ids:
+                engine.dispose()
+                disposed_ids.add(id(engine))
+
+    def _close_ping_conn(self, engine):
+        """Close and forget the cached ping connection for an engine."""
+        raw_conn = self._ping_conns.pop(id(engine), None)
+        if raw_conn is not None:
+            try:
+                raw_conn.close()
+            except Exception:
+                pass
+
     def _test_all_connections(self) -> bool:
         """Test all database connections."""
         # Track unique engines to avoid testing the same engine multiple times
         tested_engine_ids = set()
         
-        for db_config in self.db_configs.values():
-            engine = getattr(self, db_config['engine_attr'], None)
-            if engine:
-                engine_id = id(engine)
-                if engine_id not in tested_engine_ids:
-                    if not self._test_connection(engine):
-                        return False
-                    tested_engine_ids.add(engine_id)
+        for engine in self._engines.values():
+            engine_id = id(engine)
+            if engine_id not in tested_engine_ids:
+                if not self._test_connection(engine):
+                    return False
+                tested_engine_ids.add(engine_id)
         
         return True
 
@@ -450,10 +863,7 @@ class DatabaseManager:
         self.stats["reconnections"] += 1
         
         # Store old engines
-        old_engines = {}
-        for db_config in self.db_configs.values():
-            engine_attr = db_config['engine_attr']
-            old_engines[engine_attr] = getattr(self, engine_attr, None)
+        old_engines = dict(self._engines)
         
         try:
             self._init_engines()
@@ -461,7 +871,8 @@ class DatabaseManager:
             # Dispose old engines (only unique ones)
             disposed_ids = set()
             for engine in old_engines.values():
-                if engine and id(engine) not in disposed_ids:
+                if id(engine) not in disposed_ids:
+                    self._close_ping_conn(engine)
                     engine.dispose()
                     disposed_ids.add(id(engine))
             
@@ -470,8 +881,9 @@ class DatabaseManager:
             self.logger.error(f"Reconnection failed: {str(e)[:100]}")
             
             # Restore old engines
-            for engine_attr, engine in old_engines.items():
-                setattr(self, engine_attr, engine)
+            self._engines = old_engines
+            for db_type, db_config in self.db_configs.items():
+                setattr(self, db_config['engine_attr'], old_engines.get(db_type))
             
             return False
 
@@ -485,20 +897,30 @@ class DatabaseManager:
         Returns:
             SQLAlchemy engine or None
         """
-        if database in self.db_configs:
-            engine_attr = self.db_configs[database]['engine_attr']
-            return getattr(self, engine_attr, None)
-        
-        valid_dbs = ', '.join(self.db_configs.keys())
-        self.logger.error(f"Invalid database: {database}. Must be one of: {valid_dbs}")
-        return None
+        engine = self._engines.get(database)
+        if engine is None and database not in self.db_configs:
+            valid_dbs = ', '.join(self.db_configs.keys())
+            self.logger.error(f"Invalid database: {database}. Must be one of: {valid_dbs}")
+        return engine
 
     @contextmanager
-    def _get_connection(self, database: str = "data"):
-        """Context manager for database connections."""
+    def _get_connection(self, database: str = "data", read_only: bool = False):
+        """
+        Context manager for database connections.
+
+        With ``read_only=True`` the calling thread reuses a cached AUTOCOMMIT
+        connection (no BEGIN/ROLLBACK per read, no pool checkout); it is not
+        closed on exit. Writers must use the default transactional connection.
+        """
         engine = self._get_engine(database)
         if not engine:
             raise ValueError(f"Invalid database: {database}")
+
+        if read_only:
+            conn = self._get_read_connection(database, engine)
+            if conn is not None:
+                yield conn
+                return
         
         conn = None
         try:
@@ -508,6 +930,78 @@ class DatabaseManager:
             if conn:
                 conn.close()
 
+    @contextmanager
+    def _begin(self, database: str = "data"):
+        """
+        Context manager for a write transaction: commits on exit, rolls
+        back if the block raises (``engine.begin()``).
+        """
+        engine = self._get_engine(database)
+        if not engine:
+            raise ValueError(f"Invalid database: {database}")
+
+        with engine.begin() as conn:
+            yield conn
+
+    def _get_read_connection(self, database: str, engine):
+        """
+        Return this thread's cached AUTOCOMMIT connection, or None if the cap is reached.
+
+        The connection stays checked out, so the pool's recycle and pre-ping
+        never see it: it is replaced once older than pool_recycle, and pinged
+        before reuse after READ_CONN_PING_IDLE seconds idle.
+        """
+        conn = getattr(self._tls, database, None)
+        if conn is not None:
+            if self._read_connection_usable(conn, engine):
+                conn.info["read_used_at"] = time.monotonic()
+                return conn
+            # Stale (error, too old, failed ping or engine replaced by _reconnect): drop it
+            self._close_read_connection(conn)
+            setattr(self._tls, database, None)
+
+        with self._read_conns_lock:
+            if len(self._read_conns) >= self._max_read_conns:
+                return None
+            conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            self._read_conns.add(conn)
+
+        conn.info["read_opened_at"] = conn.info["read_used_at"] = time.monotonic()
+        setattr(self._tls, database, conn)
+        return conn
+
+    def _read_connection_usable(self, conn, engine) -> bool:
+        """Check a cached read connection before reuse (invalidates it if the ping fails)."""
+        if conn.closed or conn.invalidated or conn.engine is not engine:
+            return False
+
+        now = time.monotonic()
+        recycle = self.config.database.pool_recycle
+        if recycle and recycle > 0 and now - conn.info.get("read_opened_at", now) > recycle:
+            return False
+
+        if now - conn.info.get("read_used_at", now) > self.READ_CONN_PING_IDLE:
+            try:
+                conn.exec_driver_sql("SELECT 1")
+            except Exception as e:
+                self.logger.debug(f"Cached read connection failed ping: {str(e)[:100]}")
+                try:
+                    conn.invalidate()
+                except Exception:
+                    pass
+                return False
+
+        return True
+
+    def _close_read_connection(self, conn):
+        """Close a cached read connection and release its slot."""
+        with self._read_conns_lock:
+            self._read_conns.discard(conn)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
     # ============================================
     # CORE DATAFRAME OPERATIONS
     # ============================================
@@ -562,8 +1056,8 @@ class DatabaseManager:
 
             self.logger.info(f"Preparing {table_rows:,} records for {database}.{table}...")
 
-            # Prepare DataFrame
-            df = self._prepare_dataframe(df.copy())
+            # Prepare DataFrame (shallow copy; caller must not mutate df during the call)
+            df = self._prepare_dataframe(df)
 
             # Check existing table
             table_exists = self.table_exists(table, database)
@@ -571,26 +1065,31 @@ class DatabaseManager:
             if table_exists and mode == "fail":
                 raise ValueError(f"Table '{table}' already exists and mode is 'fail'")
 
-            # Create table structure if needed
-            if mode == "replace" or not table_exists:
-                self._create_optimized_table(table, df, engine)
-
-            # Insert data
-            if self.use_batch_insert and table_rows > self.chunk_size:
-                self._batch_insert(df, table, mode if not table_exists else "append", engine)
-            else:
-                df.to_sql(
-                    name=table,
-                    con=engine,
-                    if_exists="append" if table_exists and mode != "replace" else mode,
-                    index=False,
-                    method="multi",
-                    chunksize=self.chunk_size,
-                )
+            # One connection serves all three steps: table, rows, indexes
+            with engine.connect() as conn:
+                # Create table structure if needed (or truncate it if unchanged)
+                created = False
+                if mode == "replace" or not table_exists:
+                    created = self._create_optimized_table(table, df, conn)
+                    self._invalidate_table_cache(database)
+
+                # Insert data (LOAD DATA / executemany, pandas to_sql as fallback).
+                # The table exists by now, so pandas only ever appends to it.
+                if self.use_batch_insert:
+                    self._batch_insert(df, table, engine, conn)
+                else:
+                    df.to_sql(
+                        name=table,
+                        con=conn,
+                        if_exists="append",
+                        index=False,
+                        method="multi",
+                        chunksize=self.chunk_size,
+                    )
 
-            # Create indexes for new tables
-            if mode == "replace" or not table_exists:
-                self._create_indexes(table, df, engine)
+                # Create indexes for new tables (a truncated table keeps its own)
+                if created:
+                    self._create_indexes(table, df, conn)
 
             # Update statistics
             self.stats["rows_inserted"] += table_rows
@@ -603,9 +1102,7 @@ class DatabaseManager:
             self._track_operation("df_to_db", operation_time, table_rows)
 
             if metrics:
-                metrics.counter('app_db_queries_total', {'database': database, 'operation': 'insert', 'status': 'success'})
-                metrics.gauge_set('app_db_query_duration_seconds', round(operation_time, 3), {'database': database, 'operation': 'insert'})
-                metrics.counter_add('app_db_query_duration_total_seconds', round(operation_time, 3), {'database': database, 'operation': 'insert'})
+                metrics.record_db_op(database, 'insert', 'success', operation_time)
 
             self.logger.info(
                 f"✅ Stored {table_rows:,} rows in {database}.{table} "
@@ -616,7 +1113,7 @@ class DatabaseManager:
 
         except Exception as e:
             if metrics:
-                metrics.counter('app_db_queries_total', {'database': database, 'operation': 'insert', 'status': 'failed'})
+                metrics.record_db_op(database, 'insert', 'failed')
 
             self.logger.error(f"Failed to store data in {database}.{table}: {str(e)[:200]}")
             self.stats["errors"] += 1
@@ -635,7 +1132,11 @@ class DatabaseManager:
         offset: int = None,
         sort_by: str = None,
         sort_order: str = "asc",
-    ) -> pd.DataFrame:
+        stream: bool = False,
+        stream_chunk: int = 50_000,
+        params: Dict = None,
+        use_arrow: bool = False,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Retrieve DataFrame from specified database.
 
@@ -649,9 +1150,15 @@ class DatabaseManager:
             offset: Offset for pagination
             sort_by: Column to sort by
             sort_order: 'asc' or 'desc'
+            stream: Return an iterator of DataFrames instead of one DataFrame
+            stream_chunk: Rows per DataFrame when streaming
+            params: Bound values for ``:name`` placeholders in query (a list
+                value expands, e.g. ``IN :oids``)
+            use_arrow: Read through connectorx when installed; only applies to
+                full-table reads (no query, no limit)
 
         Returns:
-            DataFrame with retrieved data
+            DataFrame with retrieved data (iterator of DataFrames if stream=True)
 
         Examples:
             # Get from user data database
@@ -665,30 +1172,56 @@ class DatabaseManager:
                             filters={'status': 'current'},
                             sort_by='object_name',
                             limit=50, offset=0)
+
+            # Export a whole table through connectorx (if installed)
+            df = db.db_to_df('my_table', use_arrow=True)
+
+            # Process a large table chunk by chunk
+            for chunk in db.db_to_df('my_table', stream=True):
+                ...
+
+            # Custom query with bound values
+            df = db.db_to_df(None, query="SELECT * FROM t WHERE oid = :oid",
+                             params={'oid': '1.3.6.1.2.1.1.1'})
         """
         if not self.connected:
             self.logger.error("Database not connected")
-            return pd.DataFrame()
+            return iter(()) if stream else pd.DataFrame()
 
         # Get engine
         engine = self._get_engine(database)
         if not engine:
-            return pd.DataFrame()
+            return iter(()) if stream else pd.DataFrame()
+
+        if stream:
+            if query:
+                clause, params = _text_with_params(query, params), params or {}
+            else:
+                clause, params = self._build_select_query(
+                    table, filters, columns, limit, offset, sort_by, sort_order
+                )
+            return self._iter_sql_chunks(clause, params, engine, database, table, stream_chunk)
 
         operation_start = time.time()
         metrics = get_metrics_service()
 
         try:
             if query:
-                sql = query
-                params = {}
+                clause = _text_with_params(query, params)
+                params = params or {}
             else:
-                sql, params = self._build_select_query(
+                clause, params = self._build_select_query(
                     table, filters, columns, limit, offset, sort_by, sort_order
                 )
 
-            # Read data
-            df = pd.read_sql_query(text(sql), engine, params=params)
+            # Read data (Arrow only for opted-in full-table reads, where the
+            # per-row cost of the pandas path outweighs connectorx's setup)
+            df = None
+            if use_arrow and not query and limit is None:
+                df = self._read_sql_arrow(clause, params, database)
+            if df is None:
+                with self._get_connection(database, read_only=True) as conn:
+                    df = pd.read_sql_query(clause, conn, params=params)
 
             # Update statistics
             self.stats["rows_retrieved"] += len(df)
@@ -699,9 +1232,7 @@ class DatabaseManager:
             self._track_operation("db_to_df", operation_time, len(df))
 
             if metrics:
-                metrics.counter('app_db_queries_total', {'database': database, 'operation': 'select', 'status': 'success'})
-                metrics.gauge_set('app_db_query_duration_seconds', round(operation_time, 3), {'database': database, 'operation': 'select'})
-                metrics.counter_add('app_db_query_duration_total_seconds', round(operation_time, 3), {'database': database, 'operation': 'select'})
+                metrics.record_db_op(database, 'select', 'success', operation_time)
 
             if len(df) > 0:
                 self.logger.debug(
@@ -712,12 +1243,152 @@ class DatabaseManager:
 
         except Exception as e:
             if metrics:
-                metrics.counter('app_db_queries_total', {'database': database, 'operation': 'select', 'status': 'failed'})
+                metrics.record_db_op(database, 'select', 'failed')
 
             self.logger.error(f"Query failed on {database}.{table}: {str(e)[:200]}")
             self.stats["errors"] += 1
             return pd.DataFrame()
 
+    def fetchall(self, query: str, database: str = "data", params: Dict = None) -> List[Tuple]:
+        """
+        Run a custom SQL query and return its rows as plain tuples.
+
+        For small result sets (counts, diagnostics) where building a
+        DataFrame costs more than the query itself.
+
+        Args:
+            query: SQL query (``:name`` placeholders for params)
+            database: Which database ('data', 'system', 'jobs')
+            params: Bound parameter values
+
+        Returns:
+            List of row tuples (empty on error)
+
+        Examples:
+            total = db.fetchall("SELECT COUNT(*) FROM trap_master_data")[0][0]
+        """
+        if not self.connected:
+            self.logger.error("Database not connected")
+            return []
+
+        operation_start = time.time()
+        metrics = get_metrics_service()
+
+        try:
+            with self._get_connection(database, read_only=True) as conn:
+                rows = [
+                    tuple(row) for row in conn.execute(_text_with_params(query, params), params or {})
+                ]
+
+            self.stats["rows_retrieved"] += len(rows)
+            self.stats["queries_executed"] += 1
+
+            operation_time = time.time() - operation_start
+            self._track_operation("fetchall", operation_time, len(rows))
+
+            if metrics:
+                metrics.record_db_op(database, 'select', 'success', operation_time)
+
+            return rows
+
+        except Exception as e:
+            if metrics:
+                metrics.record_db_op(database, 'select', 'failed')
+
+            self.logger.error(f"Query failed on {database}: {str(e)[:200]}")
+            self.stats["errors"] += 1
+            return []
+
+    def _iter_sql_chunks(
+        self, clause, params: Dict, engine, database: str, table: str, chunk_rows: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield query results as DataFrames of at most ``chunk_rows`` rows.
+
+        Uses a server-side cursor on a dedicated connection, so only one
+        chunk is held in memory at a time; the connection is released when the
+        iterator is exhausted or closed.
+        """
+        operation_start = time.time()
+        metrics = get_metrics_service()
+        total_rows = 0
+
+        try:
+            with engine.connect() as conn:
+                conn = conn.execution_options(stream_results=True)
+                for chunk in pd.read_sql_query(clause, conn, params=params, chunksize=chunk_rows):
+                    total_rows += len(chunk)
+                    self.stats["rows_retrieved"] += len(chunk)
+                    yield chunk
+
+            self.stats["queries_executed"] += 1
+            operation_time = time.time() - operation_start
+            self._track_operation("db_to_df", operation_time, total_rows)
+
+            if metrics:
+                metrics.record_db_op(database, 'select', 'success', operation_time)
+
+            self.logger.debug(
+                f"Streamed {total_rows:,} rows from {database}.{table} in {operation_time:.2f}s"
+            )
+
+        except Exception as e:
+            if metrics:
+                metrics.record_db_op(database, 'select', 'failed')
+
+            self.logger.error(f"Streaming query failed on {database}.{table}: {str(e)[:200]}")
+            self.stats["errors"] += 1
+            raise
+
+    def _read_sql_arrow(self, clause, params: Dict, database: str) -> Optional[pd.DataFrame]:
+        """
+        Read a SELECT through connectorx (Arrow buffers, no per-row Python
+        objects). Bound parameters are rendered as literals first.
+
+        Returns:
+            DataFrame, or None if connectorx is unavailable or the read failed
+            (caller falls back to pandas.read_sql_query)
+        """
+        if cx is None:
+            return None
+
+        try:
+            if params:
+                # bindparam(key, value) types each param from its value, which
+                # literal rendering of expanding (IN-list) params requires
+                clause = clause.bindparams(
+                    *(bindparam(k, v, expanding=isinstance(v, list)) for k, v in params.items())
+                )
+            sql = str(
+                clause.compile(dialect=_LITERAL_DIALECT, compile_kwargs={"literal_binds": True})
+            )
+            dsn = self._build_connection_url(
+                self.db_configs[database]['name'], self.config.database.password or ""
+            ).set(drivername="mysql", query={}).render_as_string(hide_password=False)
+            df = cx.read_sql(dsn, sql, return_type="arrow").to_pandas()
+            return self._normalize_arrow_dtypes(df)
+        except Exception as e:
+            self.logger.debug(f"connectorx read failed, using pandas: {str(e)[:200]}")
+            return None
+
+    @staticmethod
+    def _normalize_arrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast a connectorx frame to the dtypes pd.read_sql_query returns over
+        pymysql: 64-bit ints/floats, ints for BOOL/TINYINT(1), ns timestamps.
+        """
+        for col in df.columns:
+            dtype = df[col].dtype
+            if pd.api.types.is_bool_dtype(dtype):
+                df[col] = df[col].astype("int64")
+            elif pd.api.types.is_integer_dtype(dtype) and dtype != "int64":
+                df[col] = df[col].astype("int64")
+            elif pd.api.types.is_float_dtype(dtype) and dtype != "float64":
+                df[col] = df[col].astype("float64")
+            elif pd.api.types.is_datetime64_dtype(dtype) and dtype != "datetime64[ns]":
+                df[col] = df[col].astype("datetime64[ns]")
+        return df
+
     # ============================================
     # CONVENIENCE METHODS (Clearer Intent)
     # ============================================
@@ -822,14 +1493,17 @@ class DatabaseManager:
             f"CREATE TABLE {target_db}.{target_table} LIKE {source_db}.{source_table};"
         )
         copy_data_sql = (
-            f"INSERT INTO {target_db}.{target_table} SELECT * FROM {source_db}.{source_table};"
+            f"INSERT INTO {target_db}.{target_table} SELECT * FROM {source_db}.{source_table}"
         )
         
         # Execute query
+        table_created = False
         try:
             with self._get_connection("data") as conn:
                 # Create table
                 conn.execute(text(create_table_sql))
+                table_created = True
+                self._invalidate_table_cache("data")
                 
                 # Track table creation
                 if metrics:
@@ -839,27 +1513,29 @@ class DatabaseManager:
                         'status': 'success'
                     })
                 
-                # Copy data
-                result = conn.execute(text(copy_data_sql))
-                rows_copied = result.rowcount
-                conn.commit()
+                # Split the copy into id ranges (short transactions, no long undo)
+                try:
+                    min_id, max_id = conn.execute(
+                        text(f"SELECT MIN(id), MAX(id) FROM {source_db}.{source_table}")
+                    ).fetchone()
+                except OperationalError:
+                    # Source table has no id column (e.g. created by pandas to_sql)
+                    conn.rollback()
+                    min_id = max_id = None
+
+                if min_id is None or max_id - min_id < self.COPY_CHUNK_ROWS:
+                    # Small or non-indexed source: single statement
+                    result = conn.execute(text(copy_data_sql))
+                    rows_copied = result.rowcount
+                    conn.commit()
+                else:
+                    conn.commit()
+                    rows_copied = self._copy_id_ranges(copy_data_sql, min_id, max_id)
                 
                 # Track insert operation
                 operation_time = time.time() - operation_start
                 if metrics:
-                    metrics.counter('app_db_queries_total', {
-                        'database': 'data',
-                        'operation': 'insert',
-                        'status': 'success'
-                    })
-                    metrics.gauge_set('app_db_query_duration_seconds', round(operation_time, 3), {
-                        'database': 'data',
-                        'operation': 'insert'
-                    })
-                    metrics.counter_add('app_db_query_duration_total_seconds', round(operation_time, 3), {
-                        'database': 'data',
-                        'operation': 'insert'
-                    })
+                    metrics.record_db_op('data', 'insert', 'success', operation_time)
                 
                 # Update stats
                 self.stats["rows_inserted"] += rows_copied
@@ -872,6 +1548,16 @@ class DatabaseManager:
             return True
             
         except Exception as e:
+            # Don't leave a partially copied table behind
+            if table_created:
+                try:
+                    with self._get_connection("data") as conn:
+                        conn.execute(text(f"DROP TABLE IF EXISTS {target_db}.{target_table}"))
+                        conn.commit()
+                except Exception:
+                    pass
+                self._invalidate_table_cache("data")
+
             # ✅ ADD: Track failure
             if metrics:
                 metrics.counter('app_db_table_operations_total', {
@@ -879,11 +1565,7 @@ class DatabaseManager:
                     'operation': 'create',
                     'status': 'failed'
                 })
-                metrics.counter('app_db_queries_total', {
-                    'database': 'data',
-                    'operation': 'insert',
-                    'status': 'failed'
-                })
+                metrics.record_db_op('data', 'insert', 'failed')
             
             self.logger.error(
                 f"Failed to copy {source_db}.{source_table} to {target_db}.{target_table}: {str(e)[:100]}"
@@ -891,41 +1573,72 @@ class DatabaseManager:
             return False
 
 
-    # ============================================
-    # TABLE OPERATIONS
-    # ============================================
-
-    def list_tables(self, database: str = "data", pattern: str = None) -> pd.DataFrame:
+    def _copy_id_ranges(self, copy_data_sql: str, min_id: int, max_id: int) -> int:
         """
-        List all tables in specified database.
-
-        Args:
-            database: Which database ('data', 'system', 'jobs')
-            pattern: Optional pattern to filter table names
+        Run ``copy_data_sql`` once per id range on the executor, each range in
+        its own transaction.
 
         Returns:
-            DataFrame with table information
+            Total number of rows copied
         """
-        if not self.connected:
-            return pd.DataFrame()
+        range_sql = text(f"{copy_data_sql} WHERE id >= :lo AND id < :hi")
+        step = self.COPY_CHUNK_ROWS
 
-        engine = self._get_engine(database)
+        def copy_range(lo: int, hi: int) -> int:
+            with self._get_connection("data") as conn:
+                result = conn.execute(range_sql, {"lo": lo, "hi": hi})
+                conn.commit()
+                return result.rowcount
+
+        futures = [
+            self._executor.submit(copy_range, lo, lo + step)
+            for lo in range(min_id, max_id + 1, step)
+        ]
+
+        rows_copied = 0
+        try:
+            for future in as_completed(futures):
+                rows_copied += future.result()
+        except Exception:
+            for future in futures:
+                future.cancel()
+            raise
+
+        return rows_copied
+
+    # ============================================
+    # TABLE OPERATIONS
+    # ============================================
+
+    def list_tables(
+        self, database: str = "data", pattern: str = None, exact_counts: bool = False
+    ) -> pd.DataFrame:
+        """
+        List all tables in specified database.
+
+        Args:
+            database: Which database ('data', 'system', 'jobs')
+            pattern: Optional pattern to filter table names
+            exact_counts: Use COUNT(*) per table instead of the InnoDB
+                estimate in information_schema.TABLES.TABLE_ROWS
+
+        Returns:
+            DataFrame with table information
+        """
+        if not self.connected:
+            return pd.DataFrame()
+
+        engine = self._get_engine(database)
         if not engine:
             return pd.DataFrame()
 
         try:
-            # Get database name
-            db_names = {
-                "data": self.config.database.parser_db,
-                "system": self.config.database.system_db,
-                "jobs": self.config.database.jobs_db,
-                "traps": self.config.database.traps_db,
-            }
-            db_name = db_names.get(database)
+            db_name = self.db_configs[database]['name']
 
             sql = """
                 SELECT 
                     TABLE_NAME as table_name,
+                    TABLE_ROWS as row_count,
                     ROUND(DATA_LENGTH/1024/1024, 2) as size_mb,
                     CREATE_TIME as created,
                     UPDATE_TIME as last_updated
@@ -945,25 +1658,16 @@ class DatabaseManager:
             # Get table metadata
             tables_df = pd.read_sql_query(text(sql), engine, params=params)
 
-            if tables_df.empty:
+            if tables_df.empty or not exact_counts:
+                tables_df['row_count'] = tables_df['row_count'].fillna(0).astype(int)
                 return tables_df
             
-            # ✅ Get accurate row counts for each table
-            with self._get_connection(database) as conn:
-                row_counts = []
-                for table_name in tables_df['table_name']:
-                    try:
-                        # Get accurate count with COUNT(*)
-                        count_query = f"SELECT COUNT(*) as count FROM `{table_name}`"
-                        count_result = conn.execute(text(count_query))
-                        row_count = count_result.scalar()
-                        row_counts.append(row_count)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to count rows for {table_name}: {e}")
-                        row_counts.append(0)
+            # ✅ Get accurate row counts (one UNION ALL query per batch of tables)
+            with self._get_connection(database, read_only=True) as conn:
+                row_counts = self._count_rows(conn, tables_df['table_name'].tolist())
 
             # Add accurate row counts to dataframe
-            tables_df['row_count'] = row_counts
+            tables_df['row_count'] = tables_df['table_name'].map(row_counts).fillna(0).astype(int)
 
             return tables_df
 
@@ -971,6 +1675,36 @@ class DatabaseManager:
             self.logger.error(f"Failed to list tables from {database}: {str(e)[:100]}")
             return pd.DataFrame()
 
+    def _count_rows(self, conn, tables: List[str]) -> Dict[str, int]:
+        """
+        Exact COUNT(*) for many tables with one UNION ALL query per
+        COUNT_BATCH_TABLES tables; a failing batch is retried per table.
+        """
+        counts = {}
+        for start in range(0, len(tables), self.COUNT_BATCH_TABLES):
+            batch = tables[start : start + self.COUNT_BATCH_TABLES]
+            sql = " UNION ALL ".join(
+                f"SELECT :t{i} AS table_name, COUNT(*) AS row_count "
+                f"FROM `{name.replace('`', '``')}`"
+                for i, name in enumerate(batch)
+            )
+            try:
+                result = conn.execute(text(sql), {f"t{i}": name for i, name in enumerate(batch)})
+                counts.update(dict(result.fetchall()))
+                continue
+            except Exception as e:
+                self.logger.debug(f"Batched row count failed, counting per table: {e}")
+
+            for name in batch:
+                try:
+                    count_query = f"SELECT COUNT(*) FROM `{name.replace('`', '``')}`"
+                    counts[name] = conn.execute(text(count_query)).scalar()
+                except Exception as e:
+                    self.logger.warning(f"Failed to count rows for {name}: {e}")
+                    counts[name] = 0
+
+        return counts
+
     def table_exists(self, table: str, database: str = "data") -> bool:
         """
         Check if table exists in specified database.
@@ -989,11 +1723,39 @@ class DatabaseManager:
         if not engine:
             return False
 
+        schema = self.db_configs[database]['name']
+        now = time.monotonic()
+
+        cached = self._table_exists_cache.get((schema, table))
+        if cached and now - cached[0] < self.TABLE_CACHE_TTL:
+            return cached[1]
+
         try:
-            inspector = inspect(engine)
-            return table in inspector.get_table_names()
+            with self._get_connection(database, read_only=True) as conn:
+                exists = conn.execute(
+                    text(
+                        "SELECT 1 FROM information_schema.TABLES "
+                        "WHERE TABLE_SCHEMA = :database AND TABLE_NAME = :table "
+                        "AND TABLE_TYPE = 'BASE TABLE' LIMIT 1"
+                    ),
+                    {"database": schema, "table": table},
+                ).first() is not None
         except Exception:
             return False
+
+        self._table_exists_cache[(schema, table)] = (now, exists)
+        return exists
+
+    def _invalidate_table_cache(self, database: str):
+        """Forget cached table_exists answers after creating, renaming or dropping a table."""
+        schema = self.db_configs[database]['name']
+        cutoff = time.monotonic() - self.TABLE_CACHE_TTL
+
+        # Also prunes expired entries so the cache stays bounded
+        self._table_exists_cache = {
+            key: value for key, value in self._table_exists_cache.items()
+            if key[0] != schema and value[0] >= cutoff
+        }
         
     # ============================================
     # TABLE OPERATIONS (ADDITIONAL METHODS)
@@ -1035,9 +1797,9 @@ class DatabaseManager:
                 return False
             
             # Rename table
-            with self._get_connection(database) as conn:
+            with self._begin(database) as conn:
                 conn.execute(text(f"RENAME TABLE `{old_name}` TO `{new_name}`"))
-                conn.commit()
+            self._invalidate_table_cache(database)
             
             self.logger.info(f"✅ Renamed table {database}.{old_name} to {new_name}")
             return True
@@ -1050,7 +1812,12 @@ class DatabaseManager:
 
     @retry_on_connection_error(max_retries=3)
     def duplicate_table(
-        self, source: str, target: str, database: str = "data", copy_data: bool = True
+        self,
+        source: str,
+        target: str,
+        database: str = "data",
+        copy_data: bool = True,
+        preserve_indexes: bool = True,
     ) -> bool:
         """
         Duplicate a table (structure and optionally data).
@@ -1060,6 +1827,8 @@ class DatabaseManager:
             target: Target table name
             database: Which database ('data', 'system', 'jobs', 'traps')
             copy_data: Whether to copy data (default: True)
+            preserve_indexes: Keep keys/indexes via CREATE TABLE ... LIKE; when
+                False, data is copied with a single CREATE TABLE ... AS SELECT
         
         Returns:
             True if successful
@@ -1086,15 +1855,26 @@ class DatabaseManager:
                 self.logger.error(f"Target table '{target}' already exists in {database}")
                 return False
             
-            with self._get_connection(database) as conn:
+            if copy_data and not preserve_indexes:
+                # Structure + data in one statement (no keys or indexes)
+                with self._begin(database) as conn:
+                    conn.execute(text(f"CREATE TABLE `{target}` AS SELECT * FROM `{source}`"))
+            else:
                 # Create table structure
-                conn.execute(text(f"CREATE TABLE `{target}` LIKE `{source}`"))
+                with self._begin(database) as conn:
+                    conn.execute(text(f"CREATE TABLE `{target}` LIKE `{source}`"))
                 
                 # Copy data if requested
                 if copy_data:
-                    conn.execute(text(f"INSERT INTO `{target}` SELECT * FROM `{source}`"))
-                
-                conn.commit()
+                    try:
+                        with self._begin(database) as conn:
+                            conn.execute(text(f"INSERT INTO `{target}` SELECT * FROM `{source}`"))
+                    except Exception:
+                        # CREATE TABLE auto-commits, so drop the empty copy ourselves
+                        with self._begin(database) as conn:
+                            conn.execute(text(f"DROP TABLE IF EXISTS `{target}`"))
+                        raise
+            self._invalidate_table_cache(database)
             
             action = "with data" if copy_data else "structure only"
             self.logger.info(f"✅ Duplicated table {database}.{source} to {target} ({action})")
@@ -1128,9 +1908,8 @@ class DatabaseManager:
                 self.logger.error(f"Table '{table}' does not exist in {database}")
                 return False
             
-            with self._get_connection(database) as conn:
+            with self._begin(database) as conn:
                 conn.execute(text(f"TRUNCATE TABLE `{table}`"))
-                conn.commit()
             
             self.logger.info(f"✅ Truncated table {database}.{table}")
             return True
@@ -1160,9 +1939,9 @@ class DatabaseManager:
             return False
 
         try:
-            with self._get_connection(database) as conn:
+            with self._begin(database) as conn:
                 conn.execute(text(f"DROP TABLE `{table}`"))
-                conn.commit()
+            self._invalidate_table_cache(database)
 
             metrics = get_metrics_service()
             if metrics:
@@ -1175,9 +1954,48 @@ class DatabaseManager:
             self.logger.error(f"Failed to delete table {database}.{table}: {str(e)[:100]}")
             return False
 
+    def _drop_table_if_exists(self, table: str, database: str = "data") -> bool:
+        """
+        Drop a table in one round-trip (no existence check).
+
+        Returns:
+            True if the table is gone (dropped or never existed)
+        """
+        if not self.connected:
+            return False
+
+        if not self._TABLE_NAME_RE.match(table):
+            self.logger.error(f"Invalid table name: {table}")
+            return False
+
+        try:
+            with self._begin(database) as conn:
+                conn.execute(text(f"DROP TABLE IF EXISTS `{table}`"))
+            self._invalidate_table_cache(database)
+
+            self.logger.info(f"Dropped table {database}.{table} (if it existed)")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to drop table {database}.{table}: {str(e)[:100]}")
+            return False
+
     def get_table_info(self, table: str, database: str = "data") -> pd.DataFrame:
         """Get table information."""
-        if not self.connected or not self.table_exists(table, database):
+        return self.get_tables_info([table], database)
+
+    def get_tables_info(self, tables: List[str], database: str = "data") -> pd.DataFrame:
+        """
+        Get table information for several tables with one query.
+
+        Args:
+            tables: Table names (missing tables are simply absent from the result)
+            database: Which database ('data', 'system', 'jobs', 'traps')
+
+        Returns:
+            DataFrame with one row per existing table
+        """
+        if not self.connected or not tables:
             return pd.DataFrame()
 
         engine = self._get_engine(database)
@@ -1185,15 +2003,9 @@ class DatabaseManager:
             return pd.DataFrame()
 
         try:
-            db_names = {
-                "data": self.config.database.parser_db,
-                "system": self.config.database.system_db,
-                "jobs": self.config.database.jobs_db,
-                "traps": self.config.database.traps_db,
-            }
-            db_name = db_names.get(database)
+            db_name = self.db_configs[database]['name']
 
-            sql = """
+            sql = text("""
                 SELECT 
                     TABLE_NAME as table_name,
                     TABLE_ROWS as row_count,
@@ -1201,11 +2013,12 @@ class DatabaseManager:
                     CREATE_TIME as created,
                     UPDATE_TIME as last_updated
                 FROM information_schema.TABLES
-                WHERE TABLE_SCHEMA = :database AND TABLE_NAME = :table
-            """
+                WHERE TABLE_SCHEMA = :database AND TABLE_NAME IN :tables
+                    AND TABLE_TYPE = 'BASE TABLE'
+            """).bindparams(bindparam("tables", expanding=True))
 
             return pd.read_sql_query(
-                text(sql), engine, params={"database": db_name, "table": table}
+                sql, engine, params={"database": db_name, "tables": list(tables)}
             )
 
         except Exception as e:
@@ -1213,9 +2026,16 @@ class DatabaseManager:
             return pd.DataFrame()
 
     def get_table_row_count(self, table: str, database: str = "data") -> int:
-        """Get row count for a table."""
-        info = self.get_table_info(table, database)
-        return int(info["row_count"].iloc[0]) if not info.empty else 0
+        """Get row count for a table (exact COUNT(*), 0 if missing or on error)."""
+        if not self.connected or not self._validate_table_name(table):
+            return 0
+
+        try:
+            with self._get_connection(database, read_only=True) as conn:
+                return int(conn.execute(text(f"SELECT COUNT(*) FROM `{table}`")).scalar())
+        except Exception as e:
+            self.logger.debug(f"Failed to count rows for {database}.{table}: {str(e)[:100]}")
+            return 0
 
     def get_table_structure(self, table: str, database: str = "data") -> pd.DataFrame:
         """Get table structure."""
@@ -1227,13 +2047,7 @@ class DatabaseManager:
             return pd.DataFrame()
 
         try:
-            db_names = {
-                "data": self.config.database.parser_db,
-                "system": self.config.database.system_db,
-                "jobs": self.config.database.jobs_db,
-                "traps": self.config.database.traps_db,
-            }
-            db_name = db_names.get(database)
+            db_name = self.db_configs[database]['name']
 
             sql = """
                 SELECT 
@@ -1265,6 +2079,10 @@ class DatabaseManager:
         Save job metadata to system database.
         Supports both full inserts and partial updates.
 
+        Saves that carry a status are a single INSERT ... ON DUPLICATE KEY
+        UPDATE (only the given fields are overwritten on an existing job);
+        saves without a status are plain UPDATEs of an existing job.
+
         Args:
             job: Job dictionary with metadata
                 - job_id (required): Job identifier
@@ -1282,127 +2100,70 @@ class DatabaseManager:
                 self.logger.error("job_id is required")
                 return False
 
-            with self._get_connection("system") as conn:
-                # Check if job exists
-                check_query = text("SELECT status FROM jobs WHERE job_id = :job_id")
-                existing = conn.execute(check_query, {"job_id": job_id}).fetchone()
-
-                if existing:
-                    # ✅ UPDATE: Build dynamic UPDATE query
-                    update_fields = []
-                    params = {"job_id": job_id}
-
-                    # Simple fields
-                    simple_fields = {
-                        "job_name": "job_name",
-                        "job_type": "job_type",
-                        "status": "status",
-                        "started_at": "started_at",
-                        "completed_at": "completed_at",
-                        "progress": "progress",
-                        "message": "message",
-                    }
-
-                    for field, db_field in simple_fields.items():
-                        if field in job:
-                            update_fields.append(f"{db_field} = :{db_field}")
-                            params[db_field] = job[field]
-
-                    # JSON fields
-                    if "result" in job:
-                        update_fields.append("result_data = :result_data")
-                        params["result_data"] = (
-                            self._json_serialize(job["result"]) if job["result"] else None
-                        )
-
-                    if "errors" in job:
-                        update_fields.append("errors = :errors")
-                        params["errors"] = (
-                            self._json_serialize(job["errors"]) if job["errors"] else None
-                        )
-
-                    if "metadata" in job:
-                        update_fields.append("metadata = :metadata")
-                        params["metadata"] = (
-                            self._json_serialize(job["metadata"]) if job["metadata"] else None
-                        )
-
-                    if not update_fields:
-                        self.logger.debug(f"No fields to update for job {job_id}")
-                        return True
-
-                    update_query = text(
-                        f"""
-                        UPDATE jobs 
-                        SET {', '.join(update_fields)}
-                        WHERE job_id = :job_id
-                    """
-                    )
-
-                    conn.execute(update_query, params)
-                    conn.commit()
-
-                    if metrics:
-                        metrics.counter('app_jobs_db_operations_total', {'operation': 'update'})
+            # Fields present in the job dict (in a fixed order, for statement caching)
+            update_fields = []
+            params = {"job_id": job_id}
+
+            # Simple fields
+            simple_fields = {
+                "job_name": "job_name",
+                "job_type": "job_type",
+                "status": "status",
+                "started_at": "started_at",
+                "completed_at": "completed_at",
+                "progress": "progress",
+                "message": "message",
+            }
 
-                    self.logger.debug(f"Updated job {job_id}")
-                    return True
+            for field, db_field in simple_fields.items():
+                if field in job:
+                    update_fields.append(db_field)
+                    params[db_field] = job[field]
+
+            # JSON fields
+            json_fields = {"result": "result_data", "errors": "errors", "metadata": "metadata"}
+
+            for field, db_field in json_fields.items():
+                if field in job:
+                    update_fields.append(db_field)
+                    params[db_field] = self._json_serialize(job[field]) if job[field] else None
+
+            if not update_fields:
+                self.logger.debug(f"No fields to update for job {job_id}")
+                return True
+
+            with self._begin("system") as conn:
+                if "status" in job:
+                    # ✅ UPSERT: new jobs get defaults, existing jobs only the given fields
+                    insert_params = {
+                        "job_type": "parse",
+                        "job_name": None,
+                        "created_at": job.get("created_at", datetime.now()),
+                        "started_at": None,
+                        "completed_at": None,
+                        "progress": 0,
+                        "message": None,
+                        "result_data": None,
+                        "errors": None,
+                        "metadata": None,
+                        **params,
+                    }
+                    result = conn.execute(_job_upsert_stmt(tuple(update_fields)), insert_params)
+                    operation = "update" if result.lastrowid else "create"
 
                 else:
-                    # ✅ INSERT: Require status for new jobs
-                    if "status" not in job:
+                    # ✅ UPDATE: one cached statement per field combination
+                    result = conn.execute(_job_update_stmt(tuple(update_fields)), params)
+                    if result.rowcount == 0:
                         self.logger.error(f"status is required for new job {job_id}")
                         return False
+                    operation = "update"
 
-                    # Serialize JSON fields
-                    result_data = (
-                        self._json_serialize(job.get("result")) if job.get("result") else None
-                    )
-                    errors = (
-                        self._json_serialize(job.get("errors", [])) if job.get("errors") else None
-                    )
-                    metadata = (
-                        self._json_serialize(job.get("metadata", {}))
-                        if job.get("metadata")
-                        else None
-                    )
-
-                    query = text(
-                        """
-                        INSERT INTO jobs (
-                            job_id, job_type, job_name, status, created_at, started_at, 
-                            completed_at, progress, message, result_data, errors, metadata
-                        ) VALUES (
-                            :job_id, :job_type, :job_name, :status, :created_at, :started_at,
-                            :completed_at, :progress, :message, :result_data, :errors, :metadata
-                        )
-                    """
-                    )
-
-                    conn.execute(
-                        query,
-                        {
-                            "job_id": job_id,
-                            "job_type": job.get("job_type", "parse"),
-                            "job_name": job.get("job_name"),
-                            "status": job["status"],
-                            "created_at": job.get("created_at", datetime.now()),
-                            "started_at": job.get("started_at"),
-                            "completed_at": job.get("completed_at"),
-                            "progress": job.get("progress", 0),
-                            "message": job.get("message"),
-                            "result_data": result_data,
-                            "errors": errors,
-                            "metadata": metadata,
-                        },
-                    )
-                    conn.commit()
-
-                    if metrics:
-                        metrics.counter('app_jobs_db_operations_total', {'operation': 'create'})
+            if metrics:
+                metrics.counter('app_jobs_db_operations_total', {'operation': operation})
 
-                    self.logger.debug(f"Inserted new job {job_id}")
-                    return True
+            self.logger.debug(f"Saved job {job_id} ({operation})")
+            return True
 
         except Exception as e:
             self.logger.error(f"Failed to save job metadata: {str(e)[:200]}", exc_info=True)
@@ -1410,47 +2171,41 @@ class DatabaseManager:
 
     def _json_serialize(self, obj):
         """Helper to serialize objects to JSON"""
-        import json
-        from datetime import date, datetime
-
-        import numpy as np
-        import pandas as pd
-
-        def json_serializer(o):
-            if isinstance(o, pd.Timestamp):
-                return o.isoformat()
-            if isinstance(o, np.datetime64):
-                return pd.Timestamp(o).isoformat()
-            if isinstance(o, (datetime, date)):
-                return o.isoformat()
-            if isinstance(o, np.integer):
-                return int(o)
-            if isinstance(o, np.floating):
-                return float(o)
-            if isinstance(o, np.ndarray):
-                return o.tolist()
-            if pd.isna(o):
-                return None
-            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
-
-        return json.dumps(obj, default=json_serializer)
+        if orjson is not None:
+            return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode()
+        return json.dumps(obj, default=_json_default)
 
     @retry_on_connection_error(max_retries=3)
-    def get_job_metadata(self, job_id: str, include_data: bool = False) -> Optional[Dict[str, Any]]:
+    def get_job_metadata(
+        self, job_id: str, include_data: bool = False, result_keys: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Get job metadata from system database.
 
         Args:
             job_id: Job ID
             include_data: Whether to include result_data
+            result_keys: With include_data, extract only these top-level
+                result keys server-side (JSON_EXTRACT) instead of
+                transferring and parsing the whole result_data blob
 
         Returns:
             Job dictionary or None if not found
+
+        Raises:
+            ValueError: If a result key is not a plain identifier
         """
+        invalid = [key for key in result_keys or [] if not self._IDENT_RE.match(key)]
+        if invalid:
+            raise ValueError(f"Invalid result keys: {', '.join(map(repr, invalid))}")
+
         try:
             metrics = get_metrics_service()
 
-            with self._get_connection("system") as conn:
+            if include_data and result_keys:
+                return self._get_job_with_result_keys(job_id, result_keys)
+
+            with self._get_connection("system", read_only=True) as conn:
                 if include_data:
                     query = text(
                         """
@@ -1479,14 +2234,14 @@ class DatabaseManager:
 
                     # Parse JSON fields
                     if include_data and job.get("result_data"):
-                        job["result"] = json.loads(job["result_data"])
+                        job["result"] = _json_loads(job["result_data"])
                         del job["result_data"]
 
                     if job.get("errors"):
-                        job["errors"] = json.loads(job["errors"]) if job["errors"] else []
+                        job["errors"] = _json_loads(job["errors"])
 
                     if job.get("metadata"):
-                        job["metadata"] = json.loads(job["metadata"]) if job["metadata"] else {}
+                        job["metadata"] = _json_loads(job["metadata"])
 
                     if metrics:
                         metrics.counter('app_jobs_db_operations_total', {'operation': 'select'})
@@ -1499,6 +2254,48 @@ class DatabaseManager:
             self.logger.error(f"Failed to get job metadata: {str(e)[:200]}")
             return None
 
+    def _get_job_with_result_keys(
+        self, job_id: str, result_keys: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """get_job_metadata variant that reads selected result keys via JSON_EXTRACT."""
+        keys = list(result_keys)  # validated by get_job_metadata
+        extracts = "".join(
+            f", JSON_EXTRACT(result_data, :path{i}) AS result_{i}" for i in range(len(keys))
+        )
+        query = text(
+            f"""
+            SELECT 
+                job_id, job_type, job_name, status, created_at, started_at,
+                completed_at, progress, message, errors, metadata{extracts}
+            FROM jobs 
+            WHERE job_id = :job_id
+        """
+        )
+        params = {"job_id": job_id, **{f"path{i}": f'$."{key}"' for i, key in enumerate(keys)}}
+
+        with self._get_connection("system", read_only=True) as conn:
+            row = conn.execute(query, params).mappings().first()
+
+        if row is None:
+            return None
+
+        job = dict(row)
+        job["result"] = {
+            key: _json_or_default(job.pop(f"result_{i}"), None) for i, key in enumerate(keys)
+        }
+
+        if job.get("errors"):
+            job["errors"] = _json_loads(job["errors"])
+
+        if job.get("metadata"):
+            job["metadata"] = _json_loads(job["metadata"])
+
+        metrics = get_metrics_service()
+        if metrics:
+            metrics.counter('app_jobs_db_operations_total', {'operation': 'select'})
+
+        return job
+
     @retry_on_connection_error(max_retries=3)
     def list_jobs(
         self,
@@ -1506,10 +2303,25 @@ class DatabaseManager:
         offset: int = 0,
         status: Optional[str] = None,
         job_type: Optional[str] = None,
+        include_data: bool = False,
+        fields: Optional[List[str]] = None,
+        after_created_at: Optional[datetime] = None,
+        after_job_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """List jobs from system database."""
+        """
+        List jobs from system database.
+
+        result_data (often the largest column) is only fetched and parsed
+        into ``result`` when include_data is True. ``fields`` narrows the
+        other columns to the given jobs columns (job_id is always included).
+
+        For deep pages pass the last row's created_at (and job_id) as
+        after_created_at/after_job_id instead of a large offset: the next
+        page is then a range seek on idx_created_at rather than an
+        OFFSET scan.
+        """
         try:
-            with self._get_connection("system") as conn:
+            with self._get_connection("system", read_only=True) as conn:
                 where_clauses = []
                 params = {"limit": limit, "offset": offset}
 
@@ -1521,49 +2333,55 @@ class DatabaseManager:
                     where_clauses.append("job_type = :job_type")
                     params["job_type"] = job_type
 
+                # Keyset pagination (rows strictly after the given position)
+                if after_created_at is not None:
+                    params["after_created_at"] = after_created_at
+                    if after_job_id:
+                        where_clauses.append(
+                            "(created_at < :after_created_at OR "
+                            "(created_at = :after_created_at AND job_id < :after_job_id))"
+                        )
+                        params["after_job_id"] = after_job_id
+                    else:
+                        where_clauses.append("created_at < :after_created_at")
+
                 where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
 
+                if fields:
+                    columns = ["job_id"] + [
+                        col for col in _JOB_COLUMNS
+                        if col in fields and col not in ("job_id", "result_data")
+                    ]
+                else:
+                    columns = [col for col in _JOB_COLUMNS if col != "result_data"]
+                if include_data:
+                    columns.append("result_data")
+
                 query = text(
                     f"""
-                    SELECT 
-                        job_id, job_type, job_name, status, created_at, started_at,
-                        completed_at, progress, message, result_data, errors, metadata
+                    SELECT {', '.join(columns)}
                     FROM jobs 
                     WHERE {where_sql}
-                    ORDER BY created_at DESC
+                    ORDER BY created_at DESC, job_id DESC
                     LIMIT :limit OFFSET :offset
                 """
                 )
 
-                results = conn.execute(query, params).fetchall()
+                jobs = conn.execute(query, params).mappings().all()
 
-                jobs = []
-                for row in results:
-                    job = dict(row._mapping)
+            # Parse JSON fields (malformed values fall back to empty defaults)
+            jobs = [dict(job) for job in jobs]
+            for job in jobs:
+                if job.get("result_data"):
+                    job["result"] = _json_or_default(job.pop("result_data"), None)
 
-                    # Parse JSON fields
-                    if job.get("result_data"):
-                        try:
-                            job["result"] = json.loads(job["result_data"])
-                            del job["result_data"]
-                        except:
-                            pass
+                if job.get("errors"):
+                    job["errors"] = _json_or_default(job["errors"], [])
 
-                    if job.get("errors"):
-                        try:
-                            job["errors"] = json.loads(job["errors"]) if job["errors"] else []
-                        except:
-                            job["errors"] = []
-
-                    if job.get("metadata"):
-                        try:
-                            job["metadata"] = json.loads(job["metadata"]) if job["metadata"] else {}
-                        except:
-                            job["metadata"] = {}
+                if job.get("metadata"):
+                    job["metadata"] = _json_or_default(job["metadata"], {})
 
-                    jobs.append(job)
-
-                return jobs
+            return jobs
 
         except Exception as e:
             self.logger.error(f"Failed to list jobs: {str(e)[:200]}", exc_info=True)
@@ -1575,21 +2393,20 @@ class DatabaseManager:
         try:
             metrics = get_metrics_service()
 
-            with self._get_connection("system") as conn:
+            with self._begin("system") as conn:
                 query = text("DELETE FROM jobs WHERE job_id = :job_id")
                 result = conn.execute(query, {"job_id": job_id})
-                conn.commit()
-
-                if metrics:
-                    if result.rowcount > 0:
-                        metrics.counter('app_jobs_db_operations_total', {'operation': 'delete'})
 
+            if metrics:
                 if result.rowcount > 0:
-                    self.logger.info(f"Deleted job metadata for {job_id}")
-                    return True
-                else:
-                    self.logger.warning(f"Job {job_id} not found in system database")
-                    return False
+                    metrics.counter('app_jobs_db_operations_total', {'operation': 'delete'})
+
+            if result.rowcount > 0:
+                self.logger.info(f"Deleted job metadata for {job_id}")
+                return True
+            else:
+                self.logger.warning(f"Job {job_id} not found in system database")
+                return False
 
         except Exception as e:
             self.logger.error(f"Failed to delete job metadata: {str(e)[:200]}")
@@ -1599,6 +2416,10 @@ class DatabaseManager:
         """
         Delete job completely (metadata + data).
 
+        The metadata DELETE is only committed once the data table is gone
+        (DROP TABLE commits on its own and cannot join the transaction), so
+        a failed drop never leaves data without its job.
+
         Args:
             job_id: Job ID
             delete_data: Whether to also delete the data table
@@ -1606,37 +2427,51 @@ class DatabaseManager:
         Returns:
             True if successful
         """
-        success = True
+        try:
+            metrics = get_metrics_service()
 
-        # Delete data table if requested
-        if delete_data:
-            table_name = f"job_{job_id.replace('-', '_')}_data"
-            if self.table_exists(table_name, "jobs"):
-                if not self.delete_table(table_name, "jobs", confirm=True):
-                    success = False
+            with self._get_connection("system") as sys_conn:
+                result = sys_conn.execute(
+                    text("DELETE FROM jobs WHERE job_id = :job_id"), {"job_id": job_id}
+                )
 
-        # Delete metadata
-        if not self.delete_job_metadata(job_id):
-            success = False
+                # Delete data table if requested (a missing table is not an error)
+                if delete_data:
+                    table_name = f"job_{job_id.replace('-', '_')}_data"
+                    if not self._drop_table_if_exists(table_name, "jobs"):
+                        sys_conn.rollback()
+                        return False
+
+                sys_conn.commit()
 
-        return success
+            if result.rowcount > 0:
+                if metrics:
+                    metrics.counter('app_jobs_db_operations_total', {'operation': 'delete'})
+                self.logger.info(f"Deleted job {job_id}" + (" and its data" if delete_data else ""))
+                return True
+
+            self.logger.warning(f"Job {job_id} not found in system database")
+            return False
+
+        except Exception as e:
+            self.logger.error(f"Failed to delete job {job_id}: {str(e)[:200]}")
+            return False
     
     def count_running_jobs(self) -> int:
         """
-        Count currently running jobs.
+        Count currently running jobs (served by idx_status).
         
         Returns:
             Number of jobs with status 'running'
         """
         try:
-            with self._get_connection("system") as conn:
+            with self._get_connection("system", read_only=True) as conn:
                 
                 query = "SELECT COUNT(*) FROM jobs WHERE status = 'running';"
                 
                 count = conn.execute(text(query)).fetchone()[0]
                 
             self.logger.debug(f"Running jobs count: {count}")
-            print(f"Running jobs count: {count}")
             
             return count
             
@@ -1644,67 +2479,315 @@ class DatabaseManager:
             self.logger.error(f"Failed to count running jobs: {e}")
             return 0  # Return 0 on error to allow job to proceed
 
+    # ============================================
+    # ASYNC WRAPPERS (for FastAPI handlers)
+    # ============================================
+    # Each call runs the sync method on a worker thread with its own pooled
+    # connection, so concurrent requests don't block the event loop or share
+    # a connection.
+
+    async def alist_jobs(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of list_jobs."""
+        return await asyncio.to_thread(self.list_jobs, *args, **kwargs)
+
+    async def aget_job_metadata(self, *args, **kwargs) -> Optional[Dict[str, Any]]:
+        """Async variant of get_job_metadata."""
+        return await asyncio.to_thread(self.get_job_metadata, *args, **kwargs)
+
+    async def acount_running_jobs(self) -> int:
+        """Async variant of count_running_jobs."""
+        return await asyncio.to_thread(self.count_running_jobs)
+
+    async def alist_tables(self, *args, **kwargs) -> pd.DataFrame:
+        """Async variant of list_tables."""
+        return await asyncio.to_thread(self.list_tables, *args, **kwargs)
+
+    async def atable_exists(self, *args, **kwargs) -> bool:
+        """Async variant of table_exists."""
+        return await asyncio.to_thread(self.table_exists, *args, **kwargs)
+
+    async def aget_table_info(self, *args, **kwargs) -> pd.DataFrame:
+        """Async variant of get_table_info."""
+        return await asyncio.to_thread(self.get_table_info, *args, **kwargs)
+
+    async def aget_tables_info(self, *args, **kwargs) -> pd.DataFrame:
+        """Async variant of get_tables_info."""
+        return await asyncio.to_thread(self.get_tables_info, *args, **kwargs)
+
+    async def aget_table_structure(self, *args, **kwargs) -> pd.DataFrame:
+        """Async variant of get_table_structure."""
+        return await asyncio.to_thread(self.get_table_structure, *args, **kwargs)
 
     # ============================================
     # HELPER METHODS
     # ============================================
 
     def _prepare_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Prepare DataFrame for database storage."""
-        # Add timestamp
-        df["imported_at"] = datetime.now()
+        """
+        Prepare DataFrame for database storage.
 
-        # Handle text columns
-        for col in df.select_dtypes(include=["object"]).columns:
-            df[col] = df[col].apply(
-                lambda x: str(x)[: self.MAX_VARCHAR_LENGTH] if pd.notna(x) else None
-            )
+        Works on a shallow copy: columns are replaced, never modified in
+        place, so the caller's frame is left untouched.
+        """
+        new_cols = {}
+
+        # Handle text columns (stringify + truncate, missing values stay missing)
+        for col, dtype in df.dtypes.items():
+            if dtype == object or pd.api.types.is_string_dtype(dtype):
+                s = df[col]
+                if dtype == object and s.dropna().head(10).map(type).isin((dict, list)).any():
+                    # Nested cells become JSON text instead of a Python repr
+                    text_s = s.map(_json_cell, na_action="ignore")
+                else:
+                    text_s = s.astype(str)
+                new_cols[col] = (
+                    text_s.str.slice(0, self.MAX_VARCHAR_LENGTH).where(s.notna(), None)
+                )
 
         # Handle datetime columns
         for col in df.select_dtypes(include=["datetime64"]).columns:
-            df[col] = pd.to_datetime(df[col]).dt.tz_localize(None)
+            new_cols[col] = pd.to_datetime(df[col]).dt.tz_localize(None)
 
         # Handle boolean columns
         for col in df.select_dtypes(include=["bool"]).columns:
-            df[col] = df[col].astype(int)
+            new_cols[col] = df[col].astype(int)
 
-        # Replace NaN with None
-        return df.where(pd.notna(df), None)
+        # Add timestamp
+        new_cols["imported_at"] = datetime.now()
+
+        # Remaining non-numeric columns (e.g. categoricals): missing -> None.
+        # Text columns were handled above; numeric/datetime NaN/NaT are
+        # written as NULL by every insert path, so they skip the full-frame mask.
+        for col, dtype in df.dtypes.items():
+            if col not in new_cols and dtype.kind not in "biufcmM":
+                s = df[col]
+                new_cols[col] = s.astype(object).where(s.notna(), None)
+
+        # Apply all column replacements at once (returns a new frame)
+        return df.assign(**new_cols)
+
+    def _batch_insert(self, df: pd.DataFrame, table: str, engine, conn=None):
+        """
+        Bulk insertion into an existing table, fastest path first.
+
+        ``conn`` (the caller's checked-out connection, if any) is used for
+        every step that needs only one connection, so the insert takes no
+        extra pool slot; only the parallel appends check out their own.
+
+        On MySQL, tries LOAD DATA LOCAL INFILE (when allowed), then
+        ``executemany`` on one DBAPI connection; if both fail, or on other
+        dialects, the frame is appended with ``to_sql``. There the first
+        chunk is written alone; for frames of 4+ chunks the remaining
+        appends run concurrently on the executor, one pooled connection per
+        chunk.
+        """
+        # df_to_db has already created the table, so rows can go straight in.
+        # Both fast paths speak MySQL (LOAD DATA, %s placeholders); any other
+        # dialect goes straight to to_sql.
+        if engine.dialect.name == "mysql":
+            if self.use_load_data and self._load_data_infile(df, table, engine, conn):
+                return
+            if self._executemany_insert(df, table, engine, conn):
+                return
 
-    def _batch_insert(self, df: pd.DataFrame, table: str, mode: str, engine):
-        """Batch insertion for large datasets."""
         total_rows = len(df)
-        chunks = [df[i : i + self.chunk_size] for i in range(0, total_rows, self.chunk_size)]
+        num_chunks = (total_rows + self.chunk_size - 1) // self.chunk_size
+
+        self.logger.debug("Batch inserting %d rows in %d chunks", total_rows, num_chunks)
+
+        con = conn if conn is not None else engine  # for the sequential to_sql steps
+        self._append_chunk(df, table, con, 0)
+
+        if total_rows < 4 * self.chunk_size:
+            for i in range(1, num_chunks):
+                self._append_chunk(df, table, con, i * self.chunk_size)
+
+            # Logged once, not per chunk (and only formatted when debug is on)
+            self.logger.debug("Inserted %d/%d rows", total_rows, total_rows)
+            return
+
+        # Each worker slices its own chunk, so only in-flight chunks are materialized
+        futures = [
+            self._executor.submit(self._append_chunk, df, table, engine, i * self.chunk_size)
+            for i in range(1, num_chunks)
+        ]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in not_done:
+            future.cancel()
+        for future in done:
+            future.result()  # re-raise the first insert error, if any
+
+        self.logger.debug(
+            "Inserted %d/%d rows (%d chunks in parallel)", total_rows, total_rows, num_chunks
+        )
 
-        self.logger.debug(f"Batch inserting {total_rows:,} rows in {len(chunks)} chunks")
+    def _append_chunk(self, df: pd.DataFrame, table: str, con, start: int):
+        """Append rows ``start:start + chunk_size`` of ``df`` with to_sql (engine or connection)."""
+        df.iloc[start : start + self.chunk_size].to_sql(
+            table, con, if_exists="append", index=False, method="multi"
+        )
+
+    def _executemany_insert(self, df: pd.DataFrame, table: str, engine, conn=None) -> bool:
+        """
+        Insert a prepared DataFrame into an existing table with
+        ``cursor.executemany``.
 
-        for i, chunk in enumerate(chunks, 1):
-            chunk.to_sql(
-                table,
-                engine,
-                if_exists="replace" if i == 1 and mode == "replace" else "append",
-                index=False,
-                method="multi",
+        Rows are built by ``itertuples`` (missing values as None) and sent in
+        ``chunk_size`` batches, which the driver rewrites into multi-row
+        INSERTs. Everything is committed once, so a failure leaves the table
+        untouched and the caller can fall back to ``to_sql``. Runs on
+        ``conn``'s DBAPI connection when given, else on a fresh raw one.
+
+        Returns:
+            True if all rows were inserted, False if the caller should fall back
+        """
+        columns = ", ".join(f"`{col}`" for col in df.columns)
+        placeholders = ", ".join(["%s"] * len(df.columns))
+        insert_sql = f"INSERT INTO `{table}` ({columns}) VALUES ({placeholders})"
+
+        # Plain Python values: NaN/NaT become None, numpy scalars become int/float
+        values = df.astype(object).where(df.notna(), None)
+
+        raw_conn = conn.connection.dbapi_connection if conn is not None else engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            try:
+                for start in range(0, len(values), self.chunk_size):
+                    chunk = values.iloc[start : start + self.chunk_size]
+                    cursor.executemany(insert_sql, list(chunk.itertuples(index=False, name=None)))
+            finally:
+                cursor.close()
+
+            raw_conn.commit()
+            return True
+
+        except Exception as e:
+            try:
+                raw_conn.rollback()
+            except Exception:
+                pass
+
+            self.logger.warning(f"executemany into {table} failed, using to_sql: {str(e)[:200]}")
+            return False
+
+        finally:
+            if conn is None:
+                raw_conn.close()
+
+    def _load_data_infile(self, df: pd.DataFrame, table: str, engine, conn=None) -> bool:
+        """
+        Bulk load a prepared DataFrame into an existing table with
+        LOAD DATA LOCAL INFILE.
+
+        Rows are written as tab-separated chunks of ``chunk_size`` rows to a
+        temporary file and loaded in a single transaction, so a failure leaves
+        the table untouched and the caller can fall back to ``to_sql``. A load
+        that raises warnings counts as a failure, since LOCAL downgrades data
+        errors to warnings and the INSERT path reports them properly. Runs on
+        ``conn``'s DBAPI connection when given, else on a fresh raw one.
+
+        Returns:
+            True if all rows were loaded, False if the caller should fall back
+        """
+        # Escape text cells so no field contains a tab, newline or backslash
+        text_cols = [
+            col for col, dtype in df.dtypes.items()
+            if dtype == object or pd.api.types.is_string_dtype(dtype)
+        ]
+        df = df.assign(**{
+            col: df[col].map(
+                lambda v: v.translate(_LOAD_DATA_ESCAPES) if isinstance(v, str) else v
             )
+            for col in text_cols
+        })
+
+        columns = ", ".join(f"`{col}`" for col in df.columns)
+        load_sql = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table}` CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+            f"({columns})"
+        )
 
-            if i % 10 == 0 or i == len(chunks):
-                self.logger.debug(
-                    f"Inserted {min(i * self.chunk_size, total_rows):,}/{total_rows:,} rows"
-                )
+        raw_conn = conn.connection.dbapi_connection if conn is not None else engine.raw_connection()
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", suffix=".tsv", encoding="utf-8", newline="", delete=False
+            ) as tmp:
+                tmp_path = tmp.name
+
+            cursor = raw_conn.cursor()
+            try:
+                for start in range(0, len(df), self.chunk_size):
+                    df.iloc[start : start + self.chunk_size].to_csv(
+                        tmp_path,
+                        sep="\t",
+                        header=False,
+                        index=False,
+                        na_rep="\\N",
+                        quoting=csv.QUOTE_NONE,
+                        quotechar=None,
+                        lineterminator="\n",
+                        encoding="utf-8",
+                    )
+                    cursor.execute(load_sql, (tmp_path,))
+
+                    # LOCAL turns data errors (truncation, bad values, column
+                    # count) into warnings, so treat any warning as a failure
+                    warnings_raised = getattr(cursor, "warning_count", 0)
+                    if warnings_raised:
+                        cursor.execute("SHOW WARNINGS LIMIT 3")
+                        details = "; ".join(str(row[2]) for row in cursor.fetchall())
+                        raise RuntimeError(
+                            f"LOAD DATA produced {warnings_raised} warning(s): {details}"
+                        )
+            finally:
+                cursor.close()
+
+            raw_conn.commit()
+            return True
+
+        except Exception as e:
+            try:
+                raw_conn.rollback()
+            except Exception:
+                pass
+
+            code = e.args[0] if e.args and isinstance(e.args[0], int) else None
+            if code in _LOCAL_INFILE_DISABLED_ERRORS:
+                self.use_load_data = False
+                self.logger.info("LOAD DATA LOCAL INFILE not allowed by server, using INSERT path")
+            else:
+                self.logger.warning(f"Bulk load into {table} failed, using INSERT path: {str(e)[:200]}")
+            return False
+
+        finally:
+            if conn is None:
+                raw_conn.close()
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     def _validate_table_name(self, table: str) -> bool:
         """Validate table name."""
-        if len(table) > self.MAX_IDENTIFIER_LENGTH:
-            return False
-        if not re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", table):
-            return False
-        if table.lower() in self.RESERVED_WORDS:
-            return False
-        return True
+        # Same rule as _TABLE_NAME_RE (ASCII letter, then letters, digits,
+        # underscores) with C-level str checks instead of the regex engine
+        return (
+            len(table) <= self.MAX_IDENTIFIER_LENGTH
+            and table.isascii()
+            and table.isidentifier()
+            and table[0].isalpha()
+            and table.lower() not in self.RESERVED_WORDS
+        )
 
     def _sanitize_table_name(self, table: str) -> str:
         """Sanitize table name."""
-        sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", table)
+        if table.isascii() and table.isidentifier():
+            sanitized = table  # nothing to replace
+        else:
+            sanitized = self._INVALID_IDENT_CHARS_RE.sub("_", table)
         if sanitized and sanitized[0].isdigit():
             sanitized = f"tbl_{sanitized}"
         return sanitized[: self.MAX_IDENTIFIER_LENGTH]
@@ -1718,128 +2801,114 @@ class DatabaseManager:
         offset: int = None,
         sort_by: str = None,
         sort_order: str = "asc",
-    ) -> Tuple[str, Dict]:
+    ) -> Tuple[TextClause, Dict]:
         """
         Build SELECT query with filters.
 
+        The statement depends only on the query *shape* (filter columns and
+        operators, column list, sort, presence of limit/offset) and is cached
+        by _compile_select_template; values are always bound parameters.
+
         Returns:
-            Tuple of (sql_query, params_dict)
+            Tuple of (cached TextClause, params_dict)
         """
-        # SELECT clause
-        if columns:
-            cols = ", ".join([f"`{col}`" for col in columns])
-        else:
-            cols = "*"
-
-        sql = f"SELECT {cols} FROM `{table}`"
+        filter_shape = []
         params = {}
 
-        # ✅ WHERE clause - Use direct string interpolation
         if filters:
-            where_clauses = []
             for col, value in filters.items():
+                # Numbered by emitted filter (unsupported dict filters are
+                # skipped), matching _compile_select_template's placeholders
+                key = f"f{len(filter_shape)}"
                 if isinstance(value, dict):
                     # Complex filter
                     if "contains" in value:
-                        search = value["contains"].replace("'", "''")  # Escape quotes
-                        where_clauses.append(f"`{col}` LIKE '%{search}%'")
+                        filter_shape.append((col, "contains", 1))
+                        params[key] = f"%{value['contains']}%"
                     elif "regex" in value:
-                        pattern = value["regex"].replace("'", "''")
-                        where_clauses.append(f"`{col}` REGEXP '{pattern}'")
+                        filter_shape.append((col, "regex", 1))
+                        params[key] = value["regex"]
                     elif "not_empty" in value and value["not_empty"]:
-                        where_clauses.append(f"(`{col}` IS NOT NULL AND `{col}` != '')")
+                        filter_shape.append((col, "not_empty", 0))
                     elif "empty" in value and value["empty"]:
-                        where_clauses.append(f"(`{col}` IS NULL OR `{col}` = '')")
+                        filter_shape.append((col, "empty", 0))
                     elif "not_in" in value:
-                        # ✅ FIX: Extract escaping outside f-string
-                        escaped_values = []
-                        for v in value["not_in"]:
-                            if isinstance(v, str):
-                                escaped = v.replace("'", "''")
-                                escaped_values.append(f"'{escaped}'")
-                            else:
-                                escaped_values.append(str(v))
-                        values_str = ", ".join(escaped_values)
-                        where_clauses.append(f"`{col}` NOT IN ({values_str})")
+                        not_in = value["not_in"]
+                        filter_shape.append((col, "not_in", int(bool(not_in))))
+                        if not_in:
+                            params[key] = list(not_in)
                     elif "gt" in value:
-                        where_clauses.append(f"`{col}` > {value['gt']}")
+                        filter_shape.append((col, "gt", 1))
+                        params[key] = value["gt"]
                     elif "lt" in value:
-                        where_clauses.append(f"`{col}` < {value['lt']}")
+                        filter_shape.append((col, "lt", 1))
+                        params[key] = value["lt"]
                     elif "gte" in value and "lte" in value:
-                        where_clauses.append(f"`{col}` BETWEEN {value['gte']} AND {value['lte']}")
+                        filter_shape.append((col, "between", 2))
+                        params[f"{key}_0"] = value["gte"]
+                        params[f"{key}_1"] = value["lte"]
                 elif isinstance(value, list):
-                    # ✅ FIX: IN clause - Extract escaping outside f-string
-                    escaped_values = []
-                    for v in value:
-                        if isinstance(v, str):
-                            escaped = v.replace("'", "''")
-                            escaped_values.append(f"'{escaped}'")
-                        else:
-                            escaped_values.append(str(v))
-                    values_str = ", ".join(escaped_values)
-                    where_clauses.append(f"`{col}` IN ({values_str})")
-                elif isinstance(value, str):
-                    # Simple string equality
-                    escaped = value.replace("'", "''")
-                    where_clauses.append(f"`{col}` = '{escaped}'")
+                    # IN clause
+                    filter_shape.append((col, "in", int(bool(value))))
+                    if value:
+                        params[key] = value  # bound as-is, expanded by the driver
                 else:
-                    # Numeric equality
-                    where_clauses.append(f"`{col}` = {value}")
-
-            if where_clauses:
-                sql += " WHERE " + " AND ".join(where_clauses)
-
-        # ORDER BY clause
-        if sort_by:
-            sql += f" ORDER BY `{sort_by}` {sort_order.upper()}"
+                    # Simple equality
+                    filter_shape.append((col, "eq", 1))
+                    params[key] = value
 
-        # LIMIT clause
         if limit:
-            sql += f" LIMIT {limit}"
+            params["limit"] = int(limit)
             if offset:
-                sql += f" OFFSET {offset}"
+                params["offset"] = int(offset)
+
+        clause = _compile_select_template(
+            table,
+            tuple(filter_shape),
+            tuple(columns) if columns else (),
+            bool(limit),
+            bool(limit and offset),
+            sort_by,
+            ("DESC" if sort_order.upper() == "DESC" else "ASC") if sort_by else None,
+        )
+
+        self.logger.debug("Built query: %s", clause)
 
-        self.logger.info(f"Built query: {sql}")
+        return clause, params
 
-        return sql, params  # params will be empty now
+    def _create_optimized_table(self, table: str, df: pd.DataFrame, conn) -> bool:
+        """
+        Create optimized table structure.
 
-    def _create_optimized_table(self, table: str, df: pd.DataFrame, engine):
-        """Create optimized table structure."""
+        The column definitions are hashed into the table comment. If the
+        existing table carries the same hash, it is truncated instead of
+        dropped and recreated (its indexes are kept).
+
+        Returns:
+            True if the table was (re)created, False if it was truncated
+        """
         try:
-            columns_sql = []
-
-            for col in df.columns:
-                dtype = str(df[col].dtype)
-
-                # Determine SQL type
-                if col.endswith("_oid"):
-                    sql_type = "VARCHAR(512)"
-                elif col.endswith("_name"):
-                    sql_type = "VARCHAR(256)"
-                elif col.endswith("_description"):
-                    sql_type = "TEXT"
-                elif col in ["tc_enumerations", "notification_objects_detail"]:
-                    sql_type = "JSON"
-                elif "int" in dtype:
-                    sql_type = "INT"
-                elif "float" in dtype:
-                    sql_type = "FLOAT"
-                elif "datetime" in dtype:
-                    sql_type = "DATETIME"
-                elif "bool" in dtype:
-                    sql_type = "BOOLEAN"
-                else:
-                    max_len = (
-                        df[col].astype(str).str.len().max() if not df[col].isna().all() else 255
-                    )
+            # Name/dtype rules are cached per frame signature; only text
+            # columns (None) are sized from the data on every call
+            sql_types = dict(
+                zip(
+                    df.columns,
+                    _column_sql_types(tuple(df.columns), tuple(str(d) for d in df.dtypes)),
+                )
+            )
+            for col, sql_type in sql_types.items():
+                if sql_type is None:
+                    max_len = _max_text_length(df[col])
                     if pd.isna(max_len) or max_len <= 255:
-                        sql_type = "VARCHAR(255)"
+                        sql_types[col] = "VARCHAR(255)"
                     elif max_len <= 65535:
-                        sql_type = "TEXT"
+                        sql_types[col] = "TEXT"
                     else:
-                        sql_type = "LONGTEXT"
+                        sql_types[col] = "LONGTEXT"
+
+            columns_sql = [f"`{col}` {sql_type}" for col, sql_type in sql_types.items()]
 
-                columns_sql.append(f"`{col}` {sql_type}")
+            schema_comment = "schema:" + hashlib.md5(", ".join(columns_sql).encode("utf-8")).hexdigest()
 
             create_sql = f"""
                 CREATE TABLE IF NOT EXISTS `{table}` (
@@ -1847,25 +2916,39 @@ class DatabaseManager:
                     {', '.join(columns_sql)},
                     KEY idx_imported (imported_at)
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+                COMMENT='{schema_comment}'
             """
 
-            with engine.connect() as conn:
-                # Drop existing table if exists
+            existing_comment = conn.execute(
+                text(
+                    "SELECT TABLE_COMMENT FROM information_schema.TABLES "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+                ),
+                {"table": table},
+            ).scalar()
+
+            # Same schema: TRUNCATE is far cheaper than DROP + CREATE
+            created = existing_comment != schema_comment
+            if created:
                 conn.execute(text(f"DROP TABLE IF EXISTS `{table}`"))
                 conn.execute(text(create_sql))
-                conn.commit()
+            else:
+                conn.execute(text(f"TRUNCATE TABLE `{table}`"))
+            conn.commit()
 
+            operation = "create" if created else "truncate"
             metrics = get_metrics_service()
             if metrics:
-                metrics.counter('app_db_table_operations_total', {'database': 'data', 'operation': 'create', 'status': 'success'})
+                metrics.counter('app_db_table_operations_total', {'database': 'data', 'operation': operation, 'status': 'success'})
 
-            self.logger.debug(f"Created table '{table}'")
+            self.logger.debug(f"{'Created' if created else 'Truncated'} table '{table}'")
+            return created
 
         except Exception as e:
             self.logger.error(f"Table creation failed: {str(e)[:200]}")
             raise
 
-    def _create_indexes(self, table: str, df: pd.DataFrame, engine):
+    def _create_indexes(self, table: str, df: pd.DataFrame, conn):
         """Create indexes for better performance."""
         index_columns = [
             "notification_name",
@@ -1876,25 +2959,42 @@ class DatabaseManager:
             "object_oid",
         ]
 
-        with engine.connect() as conn:
-            for col in index_columns:
-                if col in df.columns:
-                    try:
-                        if df[col].dtype == "object":
-                            index_sql = (
-                                f"CREATE INDEX idx_{table}_{col} ON `{table}` (`{col}`(100))"
-                            )
-                        else:
-                            index_sql = f"CREATE INDEX idx_{table}_{col} ON `{table}` (`{col}`)"
-                        conn.execute(text(index_sql))
-                    except Exception:
-                        pass
+        # (index name, key part); text columns are indexed on a 100-char prefix
+        index_defs = [
+            (
+                f"idx_{table}_{col}",
+                f"`{col}`(100)" if pd.api.types.is_string_dtype(df[col].dtype) else f"`{col}`",
+            )
+            for col in index_columns
+            if col in df.columns
+        ]
+        if not index_defs:
+            return
 
+        # One ALTER builds every index in a single table rebuild
+        try:
+            conn.execute(
+                text(
+                    f"ALTER TABLE `{table}` "
+                    + ", ".join(f"ADD INDEX {name} ({key})" for name, key in index_defs)
+                )
+            )
             conn.commit()
+            return
+        except Exception as e:
+            conn.rollback()
+            self.logger.debug(f"Batched index creation on {table} failed, retrying per index: {str(e)[:200]}")
+
+        # e.g. one index already exists: create the rest individually
+        for name, key in index_defs:
+            try:
+                conn.execute(text(f"CREATE INDEX {name} ON `{table}` ({key})"))
+            except Exception:
+                pass
+
+        conn.commit()
 
     def _track_operation(self, op_type: str, duration: float, rows: int):
         """Track operation performance."""
         self._operation_times.append((op_type, duration, rows))
-        if len(self._operation_times) > 100:
-            self._operation_times = self._operation_times[-100:]
 
@@ -1,7 +1,17 @@
 #!/usr/bin/env python3
 import yaml
+import mmap
 import os
+import re
 import sys
+from bisect import bisect_right
+from itertools import accumulate
+
+# Optional: one-pass multi-key matching (pip install pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Directories to exclude (hardcoded)
 EXCLUDE_DIRS = {'.git', 'node_modules', 'build', '__pycache__',
@@ -26,8 +36,70 @@ def extract_leaf_keys(data, parent_key=""):
             keys.extend(extract_leaf_keys(item, full_key))
     return keys
 
+
+def build_automaton(keys):
+    """Aho-Corasick automaton over all keys (value = key's position in keys)."""
+    automaton = ahocorasick.Automaton()
+    for i, key in enumerate(keys):
+        automaton.add_word(key, i)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_matches(automaton, keys, text):
+    """
+    All (lineno, key, line) matches in text, in one pass over the file.
+
+    Ordered by line, then by the key's position in keys (same order as a
+    per-line scan over keys).
+    """
+    lines = text.split('\n')
+    line_starts = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+    hits = set()
+    for end_idx, key_idx in automaton.iter(text):
+        start = end_idx - len(keys[key_idx]) + 1
+        hits.add((bisect_right(line_starts, start) - 1, key_idx))
+    return [(lineno + 1, keys[key_idx], lines[lineno]) for lineno, key_idx in sorted(hits)]
+
+
+def build_pattern(keys):
+    """One bytes regex matching any key (longest alternatives first)."""
+    return re.compile(b"|".join(re.escape(k.encode('utf-8')) for k in sorted(keys, key=len, reverse=True)))
+
+
+def scan_file(pattern, keys, file_path):
+    """
+    (lineno, key, line) matches in one file, without a per-line Python loop.
+
+    The file is mmapped and scanned once with pattern; only lines holding
+    a hit are decoded and checked key by key (overlapping keys such as
+    ``a.b`` and ``a.b.c`` are all reported).
+    """
+    matches = []
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return matches
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lineno, counted_to, line_start = 1, 0, -1
+            for m in pattern.finditer(mm):
+                start = mm.rfind(b'\n', 0, m.start()) + 1
+                if start == line_start:
+                    continue  # another hit on the same line
+                lineno += mm[counted_to:start].count(b'\n')
+                counted_to = line_start = start
+                end = mm.find(b'\n', start)
+                line = mm[start:end if end != -1 else len(mm)].decode('utf-8', errors='ignore')
+                matches.extend((lineno, key, line) for key in keys if key in line)
+    return matches
+
+
 def search_keys(keys, search_dir):
     """Search for keys in files under search_dir, excluding EXCLUDE_DIRS."""
+    if not keys:
+        return
+    automaton = build_automaton(keys) if ahocorasick is not None else None
+    pattern = build_pattern(keys) if automaton is None else None
+
     for root, dirs, files in os.walk(search_dir):
         # Remove excluded directories from traversal
         dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
@@ -35,11 +107,14 @@ def search_keys(keys, search_dir):
         for file in files:
             file_path = os.path.join(root, file)
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    for lineno, line in enumerate(f, start=1):
-                        for key in keys:
-                            if key in line:
-                                print(f"[MATCH] {key} -> {file_path}:{lineno}   .......  {line.strip()}")
+                if automaton is not None:
+                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                        matches = find_matches(automaton, keys, f.read())
+                else:
+                    matches = scan_file(pattern, keys, file_path)
+
+                for lineno, key, line in matches:
+                    print(f"[MATCH] {key} -> {file_path}:{lineno}   .......  {line.strip()}")
             except Exception as e:
                 print(f"Could not read {file_path}: {e}")
 
@@ -61,4 +136,3 @@ if __name__ == "__main__":
 
     print("\nSearching for keys...")
     search_keys(keys, search_dir)
-
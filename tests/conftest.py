@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+@pytest.fixture
+def db_manager():
+    """
+    DatabaseManager built by its real constructor, without engines (an empty
+    host skips _init_engines), for tests that need no MySQL server.
+    """
+    from services.config_service import Config
+    from services.db_service import DatabaseManager
+
+    config = Config()
+    config.database.host = ""
+    db = DatabaseManager(config)
+    yield db
+    db.close()
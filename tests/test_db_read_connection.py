@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Tests for DatabaseManager's cached per-thread read connections.
+
+Run: python -m pytest tests/test_db_read_connection.py
+"""
+
+from sqlalchemy import create_engine
+
+from services.db_service import DatabaseManager
+
+
+def test_reused_while_fresh(db_manager):
+    engine = create_engine("sqlite://")
+    conn = db_manager._get_read_connection("data", engine)
+    assert db_manager._get_read_connection("data", engine) is conn
+
+
+def test_replaced_past_pool_recycle(db_manager):
+    db_manager.config.database.pool_recycle = 60
+    engine = create_engine("sqlite://")
+    conn = db_manager._get_read_connection("data", engine)
+    conn.info["read_opened_at"] -= 61
+
+    fresh = db_manager._get_read_connection("data", engine)
+    assert fresh is not conn
+    assert conn.closed
+    assert len(db_manager._read_conns) == 1
+
+
+def test_replaced_when_idle_ping_fails(db_manager):
+    engine = create_engine("sqlite://")
+    conn = db_manager._get_read_connection("data", engine)
+    conn.info["read_used_at"] -= DatabaseManager.READ_CONN_PING_IDLE + 1
+
+    def dead_ping(statement):
+        raise RuntimeError("server has gone away")
+
+    conn.exec_driver_sql = dead_ping
+    assert db_manager._get_read_connection("data", engine) is not conn
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Tests for DatabaseManager._build_select_query placeholder numbering.
+
+Run: python -m pytest tests/test_db_select_query.py
+"""
+
+
+def test_skipped_filter_before_scalar_filter(db_manager):
+    """A dict filter the template skips must not shift later placeholders."""
+    clause, params = db_manager._build_select_query(
+        "t", filters={"a": {"gte": 1}, "b": 5, "c": {"not_empty": False}, "d": [1, 2]}
+    )
+    sql = str(clause)
+
+    assert "`b` = :f0" in sql
+    assert "`d` IN (__[POSTCOMPILE_f1])" in sql
+    assert "`a`" not in sql and "`c`" not in sql
+    assert params == {"f0": 5, "f1": [1, 2]}
+    assert set(params) == {p for p in clause.compile().params}
+
+
+def test_between_and_scalar_filters(db_manager):
+    clause, params = db_manager._build_select_query(
+        "t", filters={"a": {"gte": 1, "lte": 9}, "b": "x"}, limit=10, offset=20
+    )
+    sql = str(clause)
+
+    assert "`a` BETWEEN :f0_0 AND :f0_1" in sql
+    assert "`b` = :f1" in sql
+    assert params == {"f0_0": 1, "f0_1": 9, "f1": "x", "limit": 10, "offset": 20}
@@ -5,13 +5,89 @@ OID Resolution Test Script
 Tests OID resolver service with various OIDs to check resolution accuracy.
 """
 
+import asyncio
 import requests
 import json
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict
 
+# Optional: concurrent requests on one event loop (falls back to a thread pool)
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: faster JSON decoding of responses (falls back to json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: on-disk response cache for repeated local runs (--cache)
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
 # Configuration
 BASE_URL = "http://localhost:8000/api/v1/snmp-walk"
 HEADERS = {"Content-Type": "application/json"}
+CONNECT_TIMEOUT = 3
+REQUEST_TIMEOUT = 5
+MAX_CONCURRENT_REQUESTS = 8
+MAX_CONSECUTIVE_ERRORS = 3  # request errors in a row before the remaining OIDs are skipped
+# Transient 5xx / connection failures are retried by the session adapter
+# (the resolve-batch POST is a read, so it is retried too)
+RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=("GET", "POST"),
+    raise_on_status=False
+)
+CACHE_NAME = ".oid_test_cache"
+CACHE_EXPIRE_SEC = 3600
+
+
+def make_session(use_cache: bool = False) -> requests.Session:
+    """
+    Keep-alive session for every request in the run (SQLite-cached with
+    use_cache), retrying transient failures per RETRY_POLICY.
+    """
+    if use_cache and CachedSession is not None:
+        session = CachedSession(CACHE_NAME, expire_after=CACHE_EXPIRE_SEC, allowable_methods=("GET", "POST"))
+    else:
+        session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=RETRY_POLICY))
+    return session
+
+
+SESSION = make_session()
+
+# Report lines are buffered and written with one sys.stdout.write per test
+# (--stream prints each line as it is produced, for live tailing)
+STREAM_OUTPUT = False
+OUTPUT_LINES = []
+
+
+def emit(line: str = ""):
+    """Add one line to the report (printed immediately with --stream)."""
+    if STREAM_OUTPUT:
+        print(line)
+    else:
+        OUTPUT_LINES.append(line)
+
+
+def flush_output():
+    """Write all buffered report lines to stdout in one call."""
+    if OUTPUT_LINES:
+        sys.stdout.write("\n".join(OUTPUT_LINES) + "\n")
+        sys.stdout.flush()
+        OUTPUT_LINES.clear()
 
 # Test OIDs (common SNMP OIDs)
 TEST_OIDS = [
@@ -130,187 +206,357 @@ TEST_OIDS = [
     },
 ]
 
+# Lower-cased expected names, computed once for the name-match checks
+for _test_case in TEST_OIDS:
+    _test_case["expected_name_lc"] = (
+        _test_case["expected_name"].lower() if _test_case.get("expected_name") else None
+    )
+
 
 def print_header(title: str):
-    """Print section header."""
-    print("\n" + "=" * 80)
-    print(f"  {title}")
-    print("=" * 80)
+    """Emit section header."""
+    emit("\n" + "=" * 80)
+    emit(f"  {title}")
+    emit("=" * 80)
 
 
-def test_single_oid(oid: str, expected_name: str = None, category: str = None) -> Dict:
-    """Test resolution of a single OID."""
-    try:
-        response = requests.get(f"{BASE_URL}/oid-resolver/resolve/{oid}")
-        
-        if response.status_code == 200:
-            data = response.json()
+def build_oid_result(oid: str, expected_name: str, category: str, status_code: int, data: Dict,
+                     expected_name_lc: str = None) -> Dict:
+    """
+    Turn one resolve response (status code + JSON body) into a result row.
+
+    expected_name_lc is expected_name already lower-cased (precomputed for
+    TEST_OIDS); it is derived here when not given.
+    """
+    if expected_name_lc is None and expected_name:
+        expected_name_lc = expected_name.lower()
+    if status_code == 200:
+        if data.get('success'):
+            result = data.get('result', {})
+            resolved_name = result.get('name')
             
-            if data.get('success'):
-                result = data.get('result', {})
-                resolved_name = result.get('name')
-                
-                # Check if name matches expected
-                name_match = False
-                if expected_name and resolved_name:
-                    name_match = expected_name.lower() in resolved_name.lower()
-                
-                return {
-                    'oid': oid,
-                    'category': category,
-                    'expected_name': expected_name,
-                    'resolved': True,
-                    'resolved_name': resolved_name,
-                    'description': result.get('description', '')[:80],
-                    'module': result.get('module'),
-                    'syntax': result.get('syntax'),
-                    'name_match': name_match,
-                    'status': 'PASS' if name_match or not expected_name else 'PARTIAL'
-                }
-            else:
-                return {
-                    'oid': oid,
-                    'category': category,
-                    'expected_name': expected_name,
-                    'resolved': False,
-                    'resolved_name': None,
-                    'description': None,
-                    'module': None,
-                    'syntax': None,
-                    'name_match': False,
-                    'status': 'NOT_FOUND'
-                }
+            # Check if name matches expected
+            name_match = False
+            if expected_name_lc and resolved_name:
+                name_match = expected_name_lc in resolved_name.lower()
+            
+            return {
+                'oid': oid,
+                'category': category,
+                'expected_name': expected_name,
+                'resolved': True,
+                'resolved_name': resolved_name,
+                'description': result.get('description', '')[:80],
+                'module': result.get('module'),
+                'syntax': result.get('syntax'),
+                'name_match': name_match,
+                'status': 'PASS' if name_match or not expected_name else 'PARTIAL'
+            }
         else:
             return {
                 'oid': oid,
                 'category': category,
                 'expected_name': expected_name,
                 'resolved': False,
-                'status': 'ERROR',
-                'error': f"HTTP {response.status_code}"
+                'resolved_name': None,
+                'description': None,
+                'module': None,
+                'syntax': None,
+                'name_match': False,
+                'status': 'NOT_FOUND'
             }
-    
+    else:
+        return build_error_result(oid, expected_name, category, f"HTTP {status_code}")
+
+
+def build_error_result(oid: str, expected_name: str, category: str, error: str) -> Dict:
+    """Result row for a request that failed."""
+    return {
+        'oid': oid,
+        'category': category,
+        'expected_name': expected_name,
+        'resolved': False,
+        'status': 'ERROR',
+        'error': error
+    }
+
+
+def build_skipped_result(oid: str, expected_name: str, category: str) -> Dict:
+    """Result row for an OID not tried because the server kept failing."""
+    return {
+        'oid': oid,
+        'category': category,
+        'expected_name': expected_name,
+        'resolved': False,
+        'status': 'SKIPPED',
+        'error': f"Skipped after {MAX_CONSECUTIVE_ERRORS} consecutive request errors"
+    }
+
+
+def test_single_oid(oid: str, expected_name: str = None, category: str = None) -> Dict:
+    """Test resolution of a single OID."""
+    status_code, data, error = get_json(f"{BASE_URL}/oid-resolver/resolve/{oid}")
+    if error is not None:
+        return build_error_result(oid, expected_name, category, error)
+    return build_oid_result(oid, expected_name, category, status_code, data)
+
+
+def parse_json(body: bytes):
+    """Decode a JSON response body (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def get_json(url: str, params: Dict = None) -> tuple:
+    """GET url on SESSION: (status_code, JSON body or {}, error or None)."""
+    try:
+        response = SESSION.get(url, params=params, timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT))
+        data = parse_json(response.content) if response.status_code == 200 else {}
+        return response.status_code, data, None
     except Exception as e:
-        return {
-            'oid': oid,
-            'category': category,
-            'expected_name': expected_name,
-            'resolved': False,
-            'status': 'ERROR',
-            'error': str(e)
-        }
+        return None, {}, str(e)
+
+
+async def _get_json_async(session, url: str, params: Dict = None) -> tuple:
+    """
+    aiohttp version of get_json, retrying like SESSION's adapter (same
+    RETRY_POLICY count, backoff and status list; aiohttp bypasses SESSION).
+    """
+    for attempt in range(RETRY_POLICY.total + 1):
+        if attempt:
+            await asyncio.sleep(RETRY_POLICY.backoff_factor * (2 ** (attempt - 1)))
+        try:
+            async with session.get(url, params=params) as response:
+                if response.status in RETRY_POLICY.status_forcelist and attempt < RETRY_POLICY.total:
+                    continue
+                data = parse_json(await response.read()) if response.status == 200 else {}
+                return response.status, data, None
+        except Exception as e:
+            if attempt == RETRY_POLICY.total:
+                return None, {}, str(e)
+
+
+async def _get_json_all_async(requests_list: List[tuple]) -> List[tuple]:
+    """Run all GETs on one aiohttp session with asyncio.gather."""
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(
+            *(_get_json_async(session, url, params) for url, params in requests_list)
+        )
+
+
+def get_json_all(requests_list: List[tuple]) -> List[tuple]:
+    """
+    Issue all (url, params) GETs concurrently; get_json results in input order.
+
+    Uses aiohttp when installed (unless SESSION is caching responses),
+    otherwise a thread pool over SESSION.
+    """
+    if aiohttp is not None and getattr(SESSION, 'cache', None) is None:
+        return asyncio.run(_get_json_all_async(requests_list))
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        return list(executor.map(lambda req: get_json(*req), requests_list))
+
+
+def resolve_all(test_cases: List[Dict]) -> List[Dict]:
+    """
+    Resolve all test OIDs concurrently, results in test_cases order.
+
+    Requests go out MAX_CONCURRENT_REQUESTS at a time; once
+    MAX_CONSECUTIVE_ERRORS requests in a row have failed (server down or
+    unreachable) the remaining OIDs are marked SKIPPED instead of each
+    waiting out its own timeout.
+    """
+    results = []
+    consecutive_errors = 0
+    for start in range(0, len(test_cases), MAX_CONCURRENT_REQUESTS):
+        chunk = test_cases[start:start + MAX_CONCURRENT_REQUESTS]
+        if consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+            results.extend(build_skipped_result(tc['oid'], tc.get('expected_name'), tc.get('category'))
+                           for tc in chunk)
+            continue
+        
+        responses = get_json_all(
+            [(f"{BASE_URL}/oid-resolver/resolve/{tc['oid']}", None) for tc in chunk]
+        )
+        for tc, (status_code, data, error) in zip(chunk, responses):
+            if error is not None:
+                consecutive_errors += 1
+                results.append(build_error_result(tc['oid'], tc.get('expected_name'), tc.get('category'), error))
+            else:
+                consecutive_errors = 0
+                results.append(build_oid_result(tc['oid'], tc.get('expected_name'), tc.get('category'), status_code,
+                                                data, tc.get('expected_name_lc')))
+    return results
+
+
+def resolve_batch(test_cases: List[Dict]) -> List[Dict]:
+    """
+    Resolve all test OIDs with one POST to /oid-resolver/resolve-batch.
+
+    Returns results in test_cases order, or None if the endpoint is not
+    available (older server), so the caller can fall back to resolve_all.
+    """
+    try:
+        response = SESSION.post(
+            f"{BASE_URL}/oid-resolver/resolve-batch",
+            json={"oids": [tc['oid'] for tc in test_cases]},
+            timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+        )
+    except Exception as e:
+        return [build_error_result(tc['oid'], tc.get('expected_name'), tc.get('category'), str(e))
+                for tc in test_cases]
+    
+    if response.status_code in (404, 405):
+        return None
+    if response.status_code != 200:
+        return [build_oid_result(tc['oid'], tc.get('expected_name'), tc.get('category'), response.status_code, {})
+                for tc in test_cases]
+    
+    # Match each OID locally, exactly as for a single resolve response
+    resolved = parse_json(response.content).get('results', {})
+    results = []
+    for tc in test_cases:
+        result = resolved.get(tc['oid'])
+        results.append(build_oid_result(
+            tc['oid'], tc.get('expected_name'), tc.get('category'), 200,
+            {'success': bool(result), 'result': result}, tc.get('expected_name_lc')
+        ))
+    return results
+
+
+STATUS_ICONS = {
+    'PASS': '✅',
+    'PARTIAL': '⚠️',
+    'NOT_FOUND': '❌',
+    'ERROR': '🔴',
+    'SKIPPED': '⏭️'
+}
 
 
 def test_batch_resolution():
     """Test batch OID resolution."""
+    # Flushed per test, so pytest shows the report and never carries it over
+    try:
+        return run_batch_resolution()
+    finally:
+        flush_output()
+
+
+def run_batch_resolution():
+    """Build the resolution report (see test_batch_resolution); returns the summary."""
     print_header("OID RESOLUTION TEST")
-    print(f"\nBase URL: {BASE_URL}")
-    print(f"Testing {len(TEST_OIDS)} OIDs...\n")
+    emit(f"\nBase URL: {BASE_URL}")
+    emit(f"Testing {len(TEST_OIDS)} OIDs...\n")
     
     results = []
     categories = {}
+    category_buckets = defaultdict(list)  # category -> its results, filled in one pass
+    status_counts = Counter()  # summary totals, also filled in the same pass
     
-    # Test each OID
-    for test_case in TEST_OIDS:
-        result = test_single_oid(
-            test_case['oid'],
-            test_case.get('expected_name'),
-            test_case.get('category')
-        )
+    # One batch request; per-OID requests (concurrent) if the server lacks it
+    batch_results = resolve_batch(TEST_OIDS)
+    if batch_results is None:
+        batch_results = resolve_all(TEST_OIDS)
+    
+    for result in batch_results:
         results.append(result)
         
         # Group by category
         category = result.get('category', 'Unknown')
+        category_buckets[category].append(result)
         if category not in categories:
             categories[category] = {'total': 0, 'resolved': 0, 'matched': 0}
         
         categories[category]['total'] += 1
+        status_counts[result['status']] += 1
         if result['resolved']:
             categories[category]['resolved'] += 1
+            status_counts['resolved'] += 1
         if result.get('name_match'):
             categories[category]['matched'] += 1
+            status_counts['matched'] += 1
     
     # Print results by category
-    for category in sorted(categories.keys()):
+    for category in sorted(category_buckets):
         print_header(f"{category} MIB")
         
-        category_results = [r for r in results if r.get('category') == category]
-        
-        for result in category_results:
-            status_icon = {
-                'PASS': '✅',
-                'PARTIAL': '⚠️',
-                'NOT_FOUND': '❌',
-                'ERROR': '🔴'
-            }.get(result['status'], '❓')
+        for result in category_buckets[category]:
+            status_icon = STATUS_ICONS.get(result['status'], '❓')
             
-            print(f"\n{status_icon} OID: {result['oid']}")
-            print(f"   Expected: {result.get('expected_name', 'N/A')}")
+            emit(f"\n{status_icon} OID: {result['oid']}")
+            emit(f"   Expected: {result.get('expected_name', 'N/A')}")
             
             if result['resolved']:
-                print(f"   Resolved: {result['resolved_name']}")
-                print(f"   Module:   {result.get('module', 'N/A')}")
-                print(f"   Syntax:   {result.get('syntax', 'N/A')}")
+                emit(f"   Resolved: {result['resolved_name']}")
+                emit(f"   Module:   {result.get('module', 'N/A')}")
+                emit(f"   Syntax:   {result.get('syntax', 'N/A')}")
                 if result.get('description'):
-                    print(f"   Desc:     {result['description']}...")
+                    emit(f"   Desc:     {result['description']}...")
+            elif result['status'] == 'SKIPPED':
+                emit(f"   Status:   Skipped (server unreachable)")
             else:
-                print(f"   Status:   Not found in trap_master_data")
+                emit(f"   Status:   Not found in trap_master_data")
                 if result.get('error'):
-                    print(f"   Error:    {result['error']}")
+                    emit(f"   Error:    {result['error']}")
     
     # Print summary
     print_header("SUMMARY")
     
     total_oids = len(results)
-    total_resolved = sum(1 for r in results if r['resolved'])
-    total_matched = sum(1 for r in results if r.get('name_match'))
-    total_not_found = sum(1 for r in results if r['status'] == 'NOT_FOUND')
-    total_errors = sum(1 for r in results if r['status'] == 'ERROR')
+    total_resolved = status_counts['resolved']
+    total_matched = status_counts['matched']
+    total_not_found = status_counts['NOT_FOUND']
+    total_errors = status_counts['ERROR']
     
     resolution_rate = (total_resolved / total_oids * 100) if total_oids > 0 else 0
     match_rate = (total_matched / total_oids * 100) if total_oids > 0 else 0
     
-    print(f"\nTotal OIDs Tested:     {total_oids}")
-    print(f"✅ Resolved:           {total_resolved} ({resolution_rate:.1f}%)")
-    print(f"✅ Name Matched:       {total_matched} ({match_rate:.1f}%)")
-    print(f"❌ Not Found:          {total_not_found}")
-    print(f"🔴 Errors:             {total_errors}")
+    emit(f"\nTotal OIDs Tested:     {total_oids}")
+    emit(f"✅ Resolved:           {total_resolved} ({resolution_rate:.1f}%)")
+    emit(f"✅ Name Matched:       {total_matched} ({match_rate:.1f}%)")
+    emit(f"❌ Not Found:          {total_not_found}")
+    emit(f"🔴 Errors:             {total_errors}")
+    if status_counts['SKIPPED']:
+        emit(f"⏭️  Skipped:            {status_counts['SKIPPED']}")
     
-    print("\n" + "-" * 80)
-    print("Resolution by Category:")
-    print("-" * 80)
+    emit("\n" + "-" * 80)
+    emit("Resolution by Category:")
+    emit("-" * 80)
     
     for category in sorted(categories.keys()):
         stats = categories[category]
         cat_rate = (stats['resolved'] / stats['total'] * 100) if stats['total'] > 0 else 0
         match_rate = (stats['matched'] / stats['total'] * 100) if stats['total'] > 0 else 0
         
-        print(f"{category:20s} {stats['resolved']:2d}/{stats['total']:2d} resolved ({cat_rate:5.1f}%)  "
+        emit(f"{category:20s} {stats['resolved']:2d}/{stats['total']:2d} resolved ({cat_rate:5.1f}%)  "
               f"{stats['matched']:2d}/{stats['total']:2d} matched ({match_rate:5.1f}%)")
     
-    print("\n" + "=" * 80)
+    emit("\n" + "=" * 80)
     
     # Recommendations
     if resolution_rate < 50:
-        print("\n⚠️  LOW RESOLUTION RATE!")
-        print("\nRecommendations:")
-        print("1. Import standard MIBs:")
-        print("   - SNMPv2-MIB (System)")
-        print("   - IF-MIB (Interfaces)")
-        print("   - IP-MIB, TCP-MIB, UDP-MIB")
-        print("   - HOST-RESOURCES-MIB")
-        print("   - BGP4-MIB (if monitoring BGP)")
-        print("\n2. Parse and sync to trap_master_data:")
-        print("   python -m core.parser --source standard_mibs --mode directory")
-        print("   Then use trap-sync API to import to trap_master_data")
+        emit("\n⚠️  LOW RESOLUTION RATE!")
+        emit("\nRecommendations:")
+        emit("1. Import standard MIBs:")
+        emit("   - SNMPv2-MIB (System)")
+        emit("   - IF-MIB (Interfaces)")
+        emit("   - IP-MIB, TCP-MIB, UDP-MIB")
+        emit("   - HOST-RESOURCES-MIB")
+        emit("   - BGP4-MIB (if monitoring BGP)")
+        emit("\n2. Parse and sync to trap_master_data:")
+        emit("   python -m core.parser --source standard_mibs --mode directory")
+        emit("   Then use trap-sync API to import to trap_master_data")
     elif resolution_rate < 80:
-        print("\n⚠️  MODERATE RESOLUTION RATE")
-        print("\nSome OIDs not found. Consider importing additional MIBs.")
+        emit("\n⚠️  MODERATE RESOLUTION RATE")
+        emit("\nSome OIDs not found. Consider importing additional MIBs.")
     else:
-        print("\n✅ EXCELLENT RESOLUTION RATE!")
-        print("\nYour MIB database is well-populated.")
+        emit("\n✅ EXCELLENT RESOLUTION RATE!")
+        emit("\nYour MIB database is well-populated.")
     
-    print("\n" + "=" * 80)
+    emit("\n" + "=" * 80)
     
     return {
         'total': total_oids,
@@ -324,6 +570,14 @@ def test_batch_resolution():
 
 def test_search_functionality():
     """Test OID search functionality."""
+    try:
+        run_search_functionality()
+    finally:
+        flush_output()
+
+
+def run_search_functionality():
+    """Build the search report (see test_search_functionality)."""
     print_header("OID SEARCH TEST")
     
     search_terms = [
@@ -334,36 +588,45 @@ def test_search_functionality():
         "cpu"
     ]
     
-    for term in search_terms:
-        try:
-            response = requests.get(
-                f"{BASE_URL}/oid-resolver/search",
-                params={"search": term, "limit": 5}
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    count = data.get('count', 0)
-                    results = data.get('results', [])
-                    
-                    print(f"\n🔍 Search: '{term}' - Found {count} results")
-                    
-                    for i, result in enumerate(results[:3], 1):
-                        print(f"   {i}. {result.get('name')} ({result.get('oid')})")
-                        print(f"      Module: {result.get('module')}")
-                else:
-                    print(f"\n❌ Search '{term}' failed")
+    # Run all searches concurrently, then print in search_terms order
+    responses = get_json_all([
+        (f"{BASE_URL}/oid-resolver/search", {"search": term, "limit": 5})
+        for term in search_terms
+    ])
+    
+    for term, (status_code, data, error) in zip(search_terms, responses):
+        if error is not None:
+            emit(f"\n🔴 Search '{term}' - Error: {error}")
+        elif status_code == 200:
+            if data.get('success'):
+                count = data.get('count', 0)
+                results = data.get('results', [])
+                
+                emit(f"\n🔍 Search: '{term}' - Found {count} results")
+                
+                for i, result in enumerate(results[:3], 1):
+                    emit(f"   {i}. {result.get('name')} ({result.get('oid')})")
+                    emit(f"      Module: {result.get('module')}")
             else:
-                print(f"\n🔴 Search '{term}' - HTTP {response.status_code}")
-        
-        except Exception as e:
-            print(f"\n🔴 Search '{term}' - Error: {e}")
+                emit(f"\n❌ Search '{term}' failed")
+        else:
+            emit(f"\n🔴 Search '{term}' - HTTP {status_code}")
     
-    print("\n" + "=" * 80)
+    emit("\n" + "=" * 80)
 
 
 if __name__ == "__main__":
+    # --cache: reuse responses from earlier runs (needs requests-cache);
+    # --clear-cache: drop them first; --stream: print lines as they are produced
+    STREAM_OUTPUT = "--stream" in sys.argv
+    if "--cache" in sys.argv or "--clear-cache" in sys.argv:
+        if CachedSession is None:
+            print("⚠️  requests-cache not installed, running without cache")
+        else:
+            SESSION = make_session(use_cache=True)
+            if "--clear-cache" in sys.argv:
+                SESSION.cache.clear()
+    
     try:
         # Test batch resolution
         summary = test_batch_resolution()
@@ -380,8 +643,11 @@ if __name__ == "__main__":
             exit(2)  # Critical
     
     except KeyboardInterrupt:
-        print("\n\n⚠️  Test interrupted by user")
+        emit("\n\n⚠️  Test interrupted by user")
         exit(130)
     except Exception as e:
-        print(f"\n\n🔴 Test failed with error: {e}")
+        emit(f"\n\n🔴 Test failed with error: {e}")
         exit(1)
+    finally:
+        flush_output()
+        SESSION.close()
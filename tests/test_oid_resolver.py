@@ -6,31 +6,72 @@ Tests both exact match and prefix match functionality
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from services.config_service import Config
-from services.db_service import DatabaseManager
-from backend.services.oid_resolver_service import OIDResolverService
+MAX_RESOLVE_WORKERS = 8
+
+# Report lines are buffered and written with one sys.stdout.write
+# (--stream prints each line as it is produced, for live tailing)
+STREAM_OUTPUT = False
+OUTPUT_LINES = []
+
+
+def emit(line: str = ""):
+    """Add one line to the report (printed immediately with --stream)."""
+    if STREAM_OUTPUT:
+        print(line)
+    else:
+        OUTPUT_LINES.append(line)
+
+
+def flush_output():
+    """Write all buffered report lines to stdout in one call."""
+    if OUTPUT_LINES:
+        sys.stdout.write("\n".join(OUTPUT_LINES) + "\n")
+        sys.stdout.flush()
+        OUTPUT_LINES.clear()
+
+
+def resolve_one(resolver, oid: str) -> tuple:
+    """resolve_oid for one OID: (result or None, exception or None)."""
+    try:
+        return resolver.resolve_oid(oid), None
+    except Exception as e:
+        return None, e
 
 
 def test_oid_resolver():
     """Test OID resolver with various scenarios"""
+    # Flushed here rather than in __main__, so the report survives pytest runs
+    try:
+        run_oid_resolver_report()
+    finally:
+        flush_output()
+
+
+def run_oid_resolver_report():
+    """Build the resolver report (see test_oid_resolver)."""
     
-    print("=" * 80)
-    print("OID Resolver Test Script")
-    print("=" * 80)
+    emit("=" * 80)
+    emit("OID Resolver Test Script")
+    emit("=" * 80)
     
-    # Initialize services
-    print("\n1. Initializing services...")
+    # Initialize services (imported here: they pull in pandas/sqlalchemy)
+    emit("\n1. Initializing services...")
     try:
+        from services.config_service import Config
+        from services.db_service import DatabaseManager
+        from backend.services.oid_resolver_service import OIDResolverService
+        
         config = Config()
         db_manager = DatabaseManager(config)
         resolver = OIDResolverService(db_manager)
-        print("✅ Services initialized")
+        emit("✅ Services initialized")
     except Exception as e:
-        print(f"❌ Failed to initialize services: {e}")
+        emit(f"❌ Failed to initialize services: {e}")
         return
     
     # Test cases
@@ -73,60 +114,72 @@ def test_oid_resolver():
         }
     ]
     
-    print("\n2. Running test cases...")
-    print("-" * 80)
+    emit("\n2. Running test cases...")
+    emit("-" * 80)
     
     passed = 0
     failed = 0
     
-    for i, test in enumerate(test_cases, 1):
-        print(f"\nTest {i}: {test['name']}")
-        print(f"  OID: {test['oid']}")
+    # Resolve every test OID in one batch (cache, one exact query, prefix match);
+    # if that fails, resolve them one by one on a thread pool (the DB driver
+    # releases the GIL while queries run). Checks and output stay sequential.
+    try:
+        batch_results = resolver.resolve_batch([test['oid'] for test in test_cases])
+        outcomes = [(batch_results.get(test['oid']), None) for test in test_cases]
+    except Exception as e:
+        emit(f"⚠️  Batch resolution failed ({e}), resolving OIDs individually")
+        with ThreadPoolExecutor(max_workers=MAX_RESOLVE_WORKERS) as executor:
+            outcomes = list(executor.map(lambda test: resolve_one(resolver, test['oid']), test_cases))
+    
+    for i, (test, (result, error)) in enumerate(zip(test_cases, outcomes), 1):
+        emit(f"\nTest {i}: {test['name']}")
+        emit(f"  OID: {test['oid']}")
         
         try:
-            result = resolver.resolve_oid(test['oid'])
+            if error is not None:
+                raise error
             
             if result is None:
                 if test['expected_type'] == 'not_found':
-                    print(f"  ✅ PASS - OID not found (as expected)")
+                    emit(f"  ✅ PASS - OID not found (as expected)")
                     passed += 1
                 else:
-                    print(f"  ❌ FAIL - Expected to find OID but got None")
+                    emit(f"  ❌ FAIL - Expected to find OID but got None")
                     failed += 1
             else:
-                print(f"  Result:")
-                print(f"    Name: {result.get('name')}")
-                print(f"    Module: {result.get('module')}")
-                print(f"    Syntax: {result.get('syntax')}")
-                print(f"    Type: {result.get('type')}")
+                emit(f"  Result:")
+                emit(f"    Name: {result.get('name')}")
+                emit(f"    Module: {result.get('module')}")
+                emit(f"    Syntax: {result.get('syntax')}")
+                emit(f"    Type: {result.get('type')}")
                 
                 if 'base_oid' in result:
-                    print(f"    Base OID: {result.get('base_oid')}")
-                    print(f"    Instance: {result.get('instance')}")
+                    emit(f"    Base OID: {result.get('base_oid')}")
+                    emit(f"    Instance: {result.get('instance')}")
                 
                 # Check if name matches expected
                 if test['expected_name'] and result.get('name') == test['expected_name']:
-                    print(f"  ✅ PASS - Name matches expected: {test['expected_name']}")
+                    emit(f"  ✅ PASS - Name matches expected: {test['expected_name']}")
                     passed += 1
                 elif test['expected_name']:
-                    print(f"  ❌ FAIL - Expected name: {test['expected_name']}, got: {result.get('name')}")
+                    emit(f"  ❌ FAIL - Expected name: {test['expected_name']}, got: {result.get('name')}")
                     failed += 1
                 else:
-                    print(f"  ✅ PASS - OID resolved")
+                    emit(f"  ✅ PASS - OID resolved")
                     passed += 1
                     
         except Exception as e:
-            print(f"  ❌ ERROR - {e}")
+            emit(f"  ❌ ERROR - {e}")
             failed += 1
     
     # Summary
-    print("\n" + "=" * 80)
-    print(f"Test Summary: {passed} passed, {failed} failed")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit(f"Test Summary: {passed} passed, {failed} failed")
+    emit("=" * 80)
     
     # Additional diagnostics
-    print("\n3. Database diagnostics...")
-    print("-" * 80)
+    emit("\n3. Database diagnostics...")
+    emit("-" * 80)
     
     # Check if IF-MIB objects exist
     query = """
@@ -146,59 +199,82 @@ def test_oid_resolver():
         ORDER BY object_oid
     """
     
-    df = db_manager.db_to_df(table=None, database='data', query=query)
+    rows = db_manager.fetchall(query, database='data')
     
-    if df.empty:
-        print("❌ No IF-MIB objects found in trap_master_data")
-        print("   Please sync if_mib table first!")
+    if not rows:
+        emit("❌ No IF-MIB objects found in trap_master_data")
+        emit("   Please sync if_mib table first!")
     else:
-        print(f"✅ Found {len(df)} IF-MIB objects:")
-        for _, row in df.iterrows():
-            print(f"   {row['object_name']}: {row['object_oid']}")
+        emit(f"✅ Found {len(rows)} IF-MIB objects:")
+        for object_name, object_oid, _, _ in rows:
+            emit(f"   {object_name}: {object_oid}")
     
     # Test the SQL query directly
-    print("\n4. Testing SQL prefix match query...")
-    print("-" * 80)
+    emit("\n4. Testing SQL prefix match query...")
+    emit("-" * 80)
     
-    test_oid = '1.3.6.1.2.1.2.2.1.2.1'
-    query_prefix = f"""
-        SELECT 
-            object_oid,
-            object_name,
-            module_name,
-            LENGTH(object_oid) as oid_length
-        FROM trap_master_data
-        WHERE '{test_oid}' LIKE CONCAT(object_oid, '%')
-        ORDER BY oid_length DESC
-        LIMIT 5
-    """
-    
-    df_prefix = db_manager.db_to_df(table=None, database='data', query=query_prefix)
-    
-    if df_prefix.empty:
-        print(f"❌ No prefix matches found for {test_oid}")
+    # Prefix-case OIDs, probed together: top 5 prefix matches each
+    probe_oids = [test['oid'] for test in test_cases if test['expected_type'] == 'prefix']
+    if not probe_oids:
+        emit("⏭️  No prefix test cases, skipping")
     else:
-        print(f"✅ Found {len(df_prefix)} prefix matches for {test_oid}:")
-        for _, row in df_prefix.iterrows():
-            print(f"   {row['object_name']}: {row['object_oid']} (length: {row['oid_length']})")
-    
+        report_prefix_matches(db_manager, probe_oids)
+
     # Check database connection
-    print("\n5. Database connection check...")
-    print("-" * 80)
+    emit("\n5. Database connection check...")
+    emit("-" * 80)
     
     query_count = "SELECT COUNT(*) as count FROM trap_master_data"
-    df_count = db_manager.db_to_df(table=None, database='data', query=query_count)
+    count_rows = db_manager.fetchall(query_count, database='data')
     
-    if not df_count.empty:
-        total_rows = df_count.iloc[0]['count']
-        print(f"✅ trap_master_data has {total_rows} rows")
+    if count_rows:
+        total_rows = count_rows[0][0]
+        emit(f"✅ trap_master_data has {total_rows} rows")
     else:
-        print("❌ Could not query trap_master_data")
+        emit("❌ Could not query trap_master_data")
+    
+    emit("\n" + "=" * 80)
+    emit("Test completed!")
+    emit("=" * 80)
+
+
+def report_prefix_matches(db_manager, probe_oids):
+    """Section 4: top prefix matches for every probe OID in one round trip."""
+    probe_params = {f"oid{i}": oid for i, oid in enumerate(probe_oids)}
+    probes = " UNION ALL ".join(f"SELECT :{name} AS oid" for name in probe_params)
+    query_prefix = f"""
+        SELECT probe_oid, object_oid, object_name, module_name, oid_length
+        FROM (
+            SELECT 
+                p.oid AS probe_oid,
+                t.object_oid,
+                t.object_name,
+                t.module_name,
+                t.object_oid_len as oid_length,
+                ROW_NUMBER() OVER (
+                    PARTITION BY p.oid ORDER BY t.object_oid_len DESC
+                ) AS rn
+            FROM ({probes}) p
+            JOIN trap_master_data t ON p.oid LIKE CONCAT(t.object_oid, '%')
+        ) ranked
+        WHERE rn <= 5
+        ORDER BY probe_oid, oid_length DESC
+    """
+    
+    matches_by_probe = {}
+    for probe_oid, *match in db_manager.fetchall(query_prefix, database='data', params=probe_params):
+        matches_by_probe.setdefault(probe_oid, []).append(match)
     
-    print("\n" + "=" * 80)
-    print("Test completed!")
-    print("=" * 80)
+    for test_oid in probe_oids:
+        matches = matches_by_probe.get(test_oid)
+        if not matches:
+            emit(f"❌ No prefix matches found for {test_oid}")
+        else:
+            emit(f"✅ Found {len(matches)} prefix matches for {test_oid}:")
+            for object_oid, object_name, _, oid_length in matches:
+                emit(f"   {object_name}: {object_oid} (length: {oid_length})")
 
 
 if __name__ == '__main__':
+    STREAM_OUTPUT = '--stream' in sys.argv
     test_oid_resolver()
@@ -1,24 +1,40 @@
-from core.protobuf_decoder import ProtobufDecoder
+import os
+from pathlib import Path
 
-proto_file = r"C:\Testing\proto_decoder\protobuf-samples\Dish5gFcaps.proto"
-ptbf_file = r"C:\Testing\proto_decoder\protobuf-samples\CfCcStats.protobuf"
+from core.protobuf_decoder import ProtobufDecoderV2
 
-decoder = ProtobufDecoder(proto_file, verbose=True)
+samples_dir = Path(r"C:\Testing\proto_decoder\protobuf-samples")
 
-# Check if CfCcStats is recognized
-print("Is CfCcStats a message?", decoder.schema_parser.is_message_type('CfCcStats'))
 
-# Get the message
-msg = decoder.schema_parser.find_message_type('CfCcStats')
-print("CfCcStats message:", msg)
-if msg:
-    print("Fields:", msg.fields)
+def short_name(full_name):
+    return full_name.rsplit('.', 1)[-1]
 
-# Decode
-result = decoder.decode_and_map(
-    ptbf_file,
-    'XcipioMetrics',
-    'output_test.json'
-)
 
-print("Result:", result)
+if __name__ == "__main__":
+    decoder = ProtobufDecoderV2(samples_dir, verbose=True)
+
+    # One-shot schema sanity check before decoding fans out
+    compile_result = decoder.compile_schema()
+    print("Compiled:", compile_result["success"], compile_result.get("error", ""))
+
+    types_by_name = {short_name(name): name for name in decoder.message_classes}
+
+    # Check if CfCcStats is recognized
+    print("Is CfCcStats a message?", 'CfCcStats' in types_by_name)
+
+    # Get the message
+    msg = decoder.message_classes.get(types_by_name.get('CfCcStats'))
+    print("CfCcStats message:", msg)
+    if msg:
+        print("Fields:", [field.name for field in msg.DESCRIPTOR.fields])
+
+    # Decode every sample, spread over worker processes (CPU-bound)
+    ptbf_files = sorted(p.name for p in samples_dir.glob("*.protobuf"))
+    results = decoder.decode_files(
+        ptbf_files,
+        types_by_name.get('XcipioMetrics', 'XcipioMetrics'),
+        max_workers=os.cpu_count()
+    )
+
+    for result in results:
+        print("Result:", result)
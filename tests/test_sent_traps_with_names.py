@@ -5,14 +5,20 @@ Test Sent Traps Storage with Names
 Validates that sent traps store original names (not OIDs) in database.
 """
 
+import atexit
 import requests
 import json
 import time
 import pymysql
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# One keep-alive session for every API call in the run
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 # ANSI color codes
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -49,19 +55,36 @@ def print_info(text: str):
     print(f"{YELLOW}ℹ️  {text}{RESET}")
 
 
+# Shared by every DB check in the run (closed at exit)
+_DB_CONN = None
+
+
+def _close_db_connection():
+    """Close the shared database connection."""
+    if _DB_CONN is not None and _DB_CONN.open:
+        _DB_CONN.close()
+
+
+atexit.register(_close_db_connection)
+
+
 def get_db_connection():
-    """Get database connection."""
+    """Get the shared database connection (reconnects if it was closed)."""
+    global _DB_CONN
+    if _DB_CONN is not None and _DB_CONN.open:
+        return _DB_CONN
     try:
-        conn = pymysql.connect(
+        _DB_CONN = pymysql.connect(
             host='localhost',
             port=3306,
             user='root',
             password='dhaka123',  # Update if you have a password
             database='mib_tool_traps',
             charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
+            cursorclass=pymysql.cursors.DictCursor,
+            autocommit=True  # each check sees current data, not a reused snapshot
         )
-        return conn
+        return _DB_CONN
     except Exception as e:
         print_error(f"Failed to connect to database: {e}")
         return None
@@ -75,7 +98,7 @@ def test_send_trap_by_name():
     
     # Send trap
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/traps/send-by-name",
             json={
                 "notification_name": "linkDown",
@@ -114,116 +137,137 @@ def test_send_trap_by_name():
         return None
 
 
-def test_verify_database_storage(trap_id: int):
-    """Verify trap is stored with names in database."""
-    print_test("\nStep 2: Verify database storage")
+def fetch_trap_and_recent(trap_id: int):
+    """
+    Fetch the sent trap and the latest 2 traps in one query.
     
+    Returns:
+        Rows newest first (the latest 2 traps, plus trap_id if older),
+        or None if the database is unavailable
+    """
     conn = get_db_connection()
     if not conn:
-        return False
+        return None
     
     try:
         with conn.cursor() as cursor:
-            # Query sent trap
             cursor.execute("""
                 SELECT 
                     id, trap_oid, trap_name, target_host, target_port,
                     varbinds, status, sent_at
                 FROM sent_traps
                 WHERE id = %s
+                OR id IN (
+                    SELECT id FROM (
+                        SELECT id FROM sent_traps ORDER BY id DESC LIMIT 2
+                    ) AS latest
+                )
+                ORDER BY id DESC
             """, (trap_id,))
             
-            trap = cursor.fetchone()
-            
-            if not trap:
-                print_error(f"Trap ID {trap_id} not found in database")
-                return False
-            
-            print_success("Trap found in database")
-            print(f"\n  Database Record:")
-            print(f"  ID: {trap['id']}")
-            print(f"  Trap OID: {trap['trap_oid']}")
-            print(f"  Trap Name: {trap['trap_name']}")
-            print(f"  Target: {trap['target_host']}:{trap['target_port']}")
-            print(f"  Status: {trap['status']}")
-            print(f"  Sent At: {trap['sent_at']}")
-            
-            # Parse varbinds
-            varbinds = json.loads(trap['varbinds']) if trap['varbinds'] else []
-            
-            print(f"\n  Varbinds ({len(varbinds)} total):")
-            
-            # Validate varbinds structure
-            all_have_names = True
-            all_have_oids = True
-            
-            for i, vb in enumerate(varbinds, 1):
-                has_name = 'name' in vb and vb['name']
-                has_oid = 'oid' in vb and vb['oid']
-                
-                if not has_name:
-                    all_have_names = False
-                if not has_oid:
-                    all_have_oids = False
-                
-                name_status = "✅" if has_name else "❌"
-                oid_status = "✅" if has_oid else "❌"
-                
-                print(f"    {i}. {name_status} Name: {vb.get('name', 'MISSING')}")
-                print(f"       {oid_status} OID: {vb.get('oid', 'MISSING')}")
-                print(f"       Type: {vb.get('type', 'N/A')}")
-                print(f"       Syntax: {vb.get('syntax', 'N/A')}")
-                print(f"       Value: {vb.get('value', 'N/A')}")
-                if vb.get('description'):
-                    desc = vb['description'][:60] + "..." if len(vb.get('description', '')) > 60 else vb.get('description', '')
-                    print(f"       Description: {desc}")
-                print()
-            
-            # Validation results
-            print(f"  Validation Results:")
-            
-            if trap['trap_name']:
-                print_success(f"Trap name stored: {trap['trap_name']}")
-            else:
-                print_error("Trap name NOT stored")
-            
-            if all_have_names:
-                print_success(f"All {len(varbinds)} varbinds have names")
-            else:
-                print_error("Some varbinds missing names")
-            
-            if all_have_oids:
-                print_success(f"All {len(varbinds)} varbinds have OIDs")
-            else:
-                print_error("Some varbinds missing OIDs")
+            return cursor.fetchall()
+    
+    except Exception as e:
+        print_error(f"Database query failed: {e}")
+        return None
+
+
+def check_database_storage(trap_id: int, rows):
+    """Verify trap is stored with names in database (rows from fetch_trap_and_recent)."""
+    print_test("\nStep 2: Verify database storage")
+    
+    if rows is None:
+        return False
+    
+    try:
+        trap = next((row for row in rows if row['id'] == trap_id), None)
+        
+        if not trap:
+            print_error(f"Trap ID {trap_id} not found in database")
+            return False
+        
+        print_success("Trap found in database")
+        print(f"\n  Database Record:")
+        print(f"  ID: {trap['id']}")
+        print(f"  Trap OID: {trap['trap_oid']}")
+        print(f"  Trap Name: {trap['trap_name']}")
+        print(f"  Target: {trap['target_host']}:{trap['target_port']}")
+        print(f"  Status: {trap['status']}")
+        print(f"  Sent At: {trap['sent_at']}")
+        
+        # Parse varbinds
+        varbinds = json.loads(trap['varbinds']) if trap['varbinds'] else []
+        
+        print(f"\n  Varbinds ({len(varbinds)} total):")
+        
+        # Validate varbinds structure
+        all_have_names = True
+        all_have_oids = True
+        
+        for i, vb in enumerate(varbinds, 1):
+            has_name = 'name' in vb and vb['name']
+            has_oid = 'oid' in vb and vb['oid']
             
-            # Check for expected fields
-            expected_fields = ['name', 'oid', 'type', 'syntax', 'value']
-            all_fields_present = all(
-                all(field in vb for field in expected_fields)
-                for vb in varbinds
-            )
+            if not has_name:
+                all_have_names = False
+            if not has_oid:
+                all_have_oids = False
             
-            if all_fields_present:
-                print_success("All expected fields present in varbinds")
-            else:
-                print_error("Some expected fields missing")
+            name_status = "✅" if has_name else "❌"
+            oid_status = "✅" if has_oid else "❌"
             
-            return (
-                trap['trap_name'] is not None and
-                all_have_names and
-                all_have_oids and
-                all_fields_present
-            )
+            print(f"    {i}. {name_status} Name: {vb.get('name', 'MISSING')}")
+            print(f"       {oid_status} OID: {vb.get('oid', 'MISSING')}")
+            print(f"       Type: {vb.get('type', 'N/A')}")
+            print(f"       Syntax: {vb.get('syntax', 'N/A')}")
+            print(f"       Value: {vb.get('value', 'N/A')}")
+            if vb.get('description'):
+                desc = vb['description'][:60] + "..." if len(vb.get('description', '')) > 60 else vb.get('description', '')
+                print(f"       Description: {desc}")
+            print()
+        
+        # Validation results
+        print(f"  Validation Results:")
+        
+        if trap['trap_name']:
+            print_success(f"Trap name stored: {trap['trap_name']}")
+        else:
+            print_error("Trap name NOT stored")
+        
+        if all_have_names:
+            print_success(f"All {len(varbinds)} varbinds have names")
+        else:
+            print_error("Some varbinds missing names")
         
+        if all_have_oids:
+            print_success(f"All {len(varbinds)} varbinds have OIDs")
+        else:
+            print_error("Some varbinds missing OIDs")
+        
+        # Check for expected fields
+        expected_fields = ['name', 'oid', 'type', 'syntax', 'value']
+        all_fields_present = all(
+            all(field in vb for field in expected_fields)
+            for vb in varbinds
+        )
+        
+        if all_fields_present:
+            print_success("All expected fields present in varbinds")
+        else:
+            print_error("Some expected fields missing")
+        
+        return (
+            trap['trap_name'] is not None and
+            all_have_names and
+            all_have_oids and
+            all_fields_present
+        )
+    
     except Exception as e:
         print_error(f"Database verification failed: {e}")
         import traceback
         traceback.print_exc()
         return False
-    
-    finally:
-        conn.close()
 
 
 def test_get_sent_history():
@@ -231,7 +275,7 @@ def test_get_sent_history():
     print_test("\nStep 3: Verify API returns names")
     
     try:
-        response = requests.get(f"{BASE_URL}/traps/sent?limit=1")
+        response = SESSION.get(f"{BASE_URL}/traps/sent?limit=1")
         
         if response.status_code != 200:
             print_error(f"Failed to get sent history: {response.status_code}")
@@ -282,55 +326,49 @@ def test_get_sent_history():
         return False
 
 
-def test_compare_old_vs_new():
-    """Compare old (OID-only) vs new (with names) storage."""
+def compare_old_vs_new(rows):
+    """Compare old (OID-only) vs new (with names) storage (rows from fetch_trap_and_recent)."""
     print_test("\nStep 4: Compare storage formats")
     
-    conn = get_db_connection()
-    if not conn:
+    if rows is None:
         return
     
     try:
-        with conn.cursor() as cursor:
-            # Get latest 2 traps
-            cursor.execute("""
-                SELECT id, trap_name, varbinds
-                FROM sent_traps
-                ORDER BY id DESC
-                LIMIT 2
-            """)
+        # Latest 2 traps (rows are newest first)
+        traps = rows[:2]
+        
+        if len(traps) < 2:
+            print_info("Not enough traps to compare")
+            return
+        
+        print(f"\n  Comparing last 2 traps:")
+        
+        for trap in traps:
+            varbinds = json.loads(trap['varbinds']) if trap['varbinds'] else []
             
-            traps = cursor.fetchall()
+            has_names = all('name' in vb and vb['name'] for vb in varbinds)
             
-            if len(traps) < 2:
-                print_info("Not enough traps to compare")
-                return
+            format_type = "NEW (with names)" if has_names else "OLD (OIDs only)"
+            status = "✅" if has_names else "⚠️"
             
-            print(f"\n  Comparing last 2 traps:")
+            print(f"\n  {status} Trap ID {trap['id']}: {format_type}")
+            print(f"     Trap Name: {trap['trap_name'] or 'N/A'}")
             
-            for trap in traps:
-                varbinds = json.loads(trap['varbinds']) if trap['varbinds'] else []
-                
-                has_names = all('name' in vb and vb['name'] for vb in varbinds)
-                
-                format_type = "NEW (with names)" if has_names else "OLD (OIDs only)"
-                status = "✅" if has_names else "⚠️"
-                
-                print(f"\n  {status} Trap ID {trap['id']}: {format_type}")
-                print(f"     Trap Name: {trap['trap_name'] or 'N/A'}")
-                
-                if varbinds:
-                    sample_vb = varbinds[0]
-                    if 'name' in sample_vb:
-                        print(f"     Sample Varbind: {sample_vb.get('name')} = {sample_vb.get('value')}")
-                    else:
-                        print(f"     Sample Varbind: {sample_vb.get('oid')} = {sample_vb.get('value')}")
-        
+            if varbinds:
+                sample_vb = varbinds[0]
+                if 'name' in sample_vb:
+                    print(f"     Sample Varbind: {sample_vb.get('name')} = {sample_vb.get('value')}")
+                else:
+                    print(f"     Sample Varbind: {sample_vb.get('oid')} = {sample_vb.get('value')}")
+    
     except Exception as e:
         print_error(f"Comparison failed: {e}")
-    
-    finally:
-        conn.close()
+
+
+def test_compare_old_vs_new():
+    """Compare storage formats of the latest 2 traps (standalone, for pytest)."""
+    # No trap was sent in this run; id 0 matches nothing, leaving the latest 2
+    compare_old_vs_new(fetch_trap_and_recent(0))
 
 
 def main():
@@ -350,14 +388,17 @@ def main():
         # Wait a moment for database write
         time.sleep(0.5)
         
+        # One DB round trip for tests 2 and 4
+        rows = fetch_trap_and_recent(trap_id)
+        
         # Test 2: Verify database storage
-        db_valid = test_verify_database_storage(trap_id)
+        db_valid = check_database_storage(trap_id, rows)
         
         # Test 3: Verify API response
         api_valid = test_get_sent_history()
         
         # Test 4: Compare formats
-        test_compare_old_vs_new()
+        compare_old_vs_new(rows)
         
         # Summary
         print_header("TEST SUMMARY")
@@ -389,6 +430,8 @@ def main():
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        SESSION.close()
 
 
 if __name__ == "__main__":